@@ -0,0 +1,33 @@
+"""JSON encode/decode helpers that use orjson when it is installed.
+
+orjson is an optional extra (``pip install synthia[fast]``); without it the
+stdlib json module is used. Both produce and accept plain JSON, so files
+written either way stay readable by the dashboard, the GUI and each other.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def json_loads(raw: bytes | str) -> Any:
+    """Parse JSON text.
+
+    Raises json.JSONDecodeError on invalid input (orjson's error subclasses it).
+    """
+    return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, indented by two spaces."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
@@ -2,21 +2,62 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
 import hashlib
-import json
 import logging
 import os
 import subprocess
+import tempfile
 import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, Protocol
 
+from synthia._jsonio import json_dumps_bytes, json_loads
 from synthia.display import is_wayland
 
 logger = logging.getLogger(__name__)
 
+# Print each text clipboard snapshot as one base64 line. The encoding keeps
+# framing exact whatever bytes the snapshot holds, and --type text stops image
+# copies from being piped through at all.
+WL_PASTE_WATCH_CMD = ["wl-paste", "--type", "text", "--watch", "sh", "-c", "base64 -w0; echo"]
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """Write data to path via a 0o600 sibling file and an atomic rename.
+
+    mkstemp creates the temp file exclusively with mode 0o600 under a fresh
+    name, so a stale or planted file (or symlink) next to the history can't
+    change its mode or redirect the write, and a failed write leaves the
+    previous file intact.
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".synthia-clipboard.")
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class _Runner(Protocol):
+    """The two process launchers the monitor needs (the subprocess module by default)."""
+
+    def run(self, *args: Any, **kwargs: Any) -> subprocess.CompletedProcess[str]: ...
+
+    def Popen(self, *args: Any, **kwargs: Any) -> subprocess.Popen: ...
+
 
 class ClipboardMonitor:
     """Monitors system clipboard and maintains history of copied items."""
@@ -25,8 +66,11 @@ class ClipboardMonitor:
         self,
         max_items: int = 5,
         history_file: Optional[str] = None,
+        runner: _Runner = subprocess,
     ) -> None:
         self.max_items = max_items
+        # Injectable so tests can pass a stub
+        self._runner = runner
         self.history_file = history_file or os.path.join(
             os.environ.get("XDG_RUNTIME_DIR", "/tmp"), "synthia-clipboard.json"
         )
@@ -35,31 +79,36 @@ class ClipboardMonitor:
         self._thread: Optional[threading.Thread] = None
         self._process: Optional[subprocess.Popen] = None
         self._last_hash: Optional[str] = None
+        self._last_content: Optional[str] = None
         self._load_history()
 
     def _load_history(self) -> None:
         """Load existing history from file."""
         try:
             if os.path.exists(self.history_file):
-                with open(self.history_file) as f:
-                    self.history = json.load(f)
+                with open(self.history_file, "rb") as f:
+                    raw = f.read()
+                self.history = json_loads(raw)
         except Exception as e:
             logger.debug("Could not load clipboard history: %s", e)
             self.history = []
 
     def _save_history(self) -> None:
         """Save history to file with restrictive permissions."""
+        # Stays JSON: the GUI reads this file directly with serde_json
         try:
-            with open(self.history_file, "w") as f:
-                json.dump(self.history, f, indent=2)
             # SECURITY: Clipboard may contain sensitive data (passwords, tokens)
-            os.chmod(self.history_file, 0o600)
+            _atomic_write(self.history_file, json_dumps_bytes(self.history))
         except Exception as e:
             logger.warning("Failed to save clipboard history: %s", e)
 
     def _content_hash(self, content: str) -> str:
-        """Generate hash of content for deduplication."""
-        return hashlib.sha256(content.encode()).hexdigest()
+        """Generate hash of content for deduplication.
+
+        Only used as a dedup fingerprint, not for integrity, so a short
+        BLAKE2b digest is enough and cheaper than SHA-256.
+        """
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
 
     def _add_item(self, content: str) -> None:
         """Add item to history (deduplicated)."""
@@ -67,16 +116,24 @@ class ClipboardMonitor:
             return
 
         content = content.strip()
-        content_hash = self._content_hash(content)
 
-        # Skip if same as last item
+        # Skip if same as last item. Comparing the text itself is exact and
+        # saves hashing an unchanged clipboard on every poll.
+        if content == self._last_content:
+            return
+
+        content_hash = self._content_hash(content)
         if content_hash == self._last_hash:
             return
 
         self._last_hash = content_hash
+        self._last_content = content
 
-        # Remove duplicate if exists
-        self.history = [h for h in self.history if h.get("hash") != content_hash]
+        # Remove duplicate if exists (at most one, since history is deduplicated)
+        for i, h in enumerate(self.history):
+            if h.get("hash") == content_hash:
+                del self.history[i]
+                break
 
         # Add new item at beginning
         item = {
@@ -87,24 +144,25 @@ class ClipboardMonitor:
         }
         self.history.insert(0, item)
 
-        # Trim to max items
-        self.history = self.history[: self.max_items]
+        # Trim to max items in place
+        del self.history[self.max_items :]
 
         self._save_history()
         logger.debug("Clipboard captured: %s...", content[:50])
 
     def _get_clipboard_content(self) -> Optional[str]:
         """Get current clipboard content."""
+        result: subprocess.CompletedProcess[str]
         try:
             if is_wayland():
-                result = subprocess.run(
+                result = self._runner.run(
                     ["wl-paste", "--no-newline"],
                     capture_output=True,
                     text=True,
                     timeout=1,
                 )
             else:
-                result = subprocess.run(
+                result = self._runner.run(
                     ["xclip", "-selection", "clipboard", "-o"],
                     capture_output=True,
                     text=True,
@@ -120,23 +178,33 @@ class ClipboardMonitor:
         """Run wl-paste --watch for efficient Wayland monitoring."""
         while self.running:
             try:
-                # wl-paste --watch runs a command each time clipboard changes
-                # We use cat to just get the content
-                self._process = subprocess.Popen(
-                    ["wl-paste", "--watch", "cat"],
+                # One long-lived wl-paste runs the command on every clipboard
+                # change; each snapshot arrives as one base64 line, so
+                # multi-line content becomes a single item.
+                self._process = self._runner.Popen(
+                    WL_PASTE_WATCH_CMD,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.DEVNULL,
-                    text=True,
+                    bufsize=0,
                 )
-
-                while self.running and self._process.poll() is None:
-                    if self._process.stdout is None:
-                        break
-                    line = self._process.stdout.readline()
-                    if line:
-                        # Accumulate content until we get empty line
-                        content = line.rstrip("\n")
-                        self._add_item(content)
+                stdout = self._process.stdout
+                pending = b""
+                while self.running and stdout is not None:
+                    chunk = stdout.read(65536)
+                    if not chunk:
+                        break  # wl-paste exited
+                    pending += chunk
+                    *lines, pending = pending.split(b"\n")
+                    for line in lines:
+                        try:
+                            text = base64.b64decode(line, validate=True).decode("utf-8")
+                        except (binascii.Error, UnicodeDecodeError):
+                            logger.debug("Skipping non-text clipboard data")
+                            continue
+                        self._add_item(text)
+
+                if self.running:
+                    time.sleep(1)  # Don't respawn in a tight loop if wl-paste dies
 
             except Exception as e:
                 logger.warning("Wayland clipboard monitor error: %s", e)
@@ -201,14 +269,14 @@ class ClipboardMonitor:
         """Copy content to system clipboard."""
         try:
             if is_wayland():
-                process = subprocess.Popen(
+                process = self._runner.Popen(
                     ["wl-copy"],
                     stdin=subprocess.PIPE,
                     text=True,
                 )
                 process.communicate(input=content)
             else:
-                process = subprocess.Popen(
+                process = self._runner.Popen(
                     ["xclip", "-selection", "clipboard"],
                     stdin=subprocess.PIPE,
                     text=True,
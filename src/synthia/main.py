@@ -416,7 +416,6 @@ class Synthia:
             self.clipboard_monitor.stop()
         if self.tray:
             self.tray.stop()
-        self.sounds.cleanup()
 
 
 def handle_memory_command(args: list[str]) -> None:
@@ -32,6 +32,15 @@ MEMORY_CATEGORIES = {
     "stack": "stack.jsonl",
 }
 
+# Field shown as the one-line summary of an entry in list views
+CATEGORY_SUMMARY_FIELD = {
+    "bug": "error",
+    "pattern": "topic",
+    "arch": "decision",
+    "gotcha": "area",
+    "stack": "tool",
+}
+
 
 @dataclass
 class MemoryEntry:
@@ -39,6 +39,7 @@ except ImportError as _textual_err:
     ) from _textual_err
 
 from synthia.memory import (
+    CATEGORY_SUMMARY_FIELD,
     MEMORY_CATEGORIES,
     MemoryEntry,
     MemorySystem,
@@ -258,23 +259,13 @@ class MemoryListItem(ListItem):
         super().__init__()
         self.entry = entry
         self.line_number = line_number
+        # Create a compact display once; compose just wraps it
+        field = CATEGORY_SUMMARY_FIELD.get(entry.category)
+        content = entry.data.get(field, "N/A")[:60] if field else "Unknown"
+        self._text = f"[{entry.category.upper()}] {content}"
 
     def compose(self) -> ComposeResult:
-        # Create a compact display
-        if self.entry.category == "bug":
-            text = f"[BUG] {self.entry.data.get('error', 'N/A')[:60]}"
-        elif self.entry.category == "pattern":
-            text = f"[PATTERN] {self.entry.data.get('topic', 'N/A')[:60]}"
-        elif self.entry.category == "arch":
-            text = f"[ARCH] {self.entry.data.get('decision', 'N/A')[:60]}"
-        elif self.entry.category == "gotcha":
-            text = f"[GOTCHA] {self.entry.data.get('area', 'N/A')[:60]}"
-        elif self.entry.category == "stack":
-            text = f"[STACK] {self.entry.data.get('tool', 'N/A')[:60]}"
-        else:
-            text = f"[{self.entry.category.upper()}] Unknown"
-
-        yield Label(text)
+        yield Label(self._text)
 
 
 class MemoryDashboard(App):
@@ -17,6 +17,12 @@ _TYPING_TIMEOUT = 10
 # Wezterm Flatpak command (detected once at import)
 _WEZTERM_CMD = None
 
+# Keyboard simulation tools available on PATH (detected once at import)
+_TYPING_BACKENDS = [b for b in ("wtype", "ydotool", "xdotool") if shutil.which(b)]
+
+# Whether the "no typing tool" warning has already been logged
+_warned_no_backend = False
+
 
 def _find_wezterm_cli() -> list[str] | None:
     """Find the wezterm CLI command (native or Flatpak)."""
@@ -117,9 +123,17 @@ def type_text(text: str) -> bool:
     4. ydotool (Wayland fallback)
     5. xdotool (X11)
     """
+    global _warned_no_backend
+
     if not text:
         return False
 
+    if not _TYPING_BACKENDS and not (is_wayland() and _get_wezterm_cmd()):
+        if not _warned_no_backend:
+            logger.warning("No typing tool found. Install wtype (Wayland) or xdotool (X11)")
+            _warned_no_backend = True
+        return False
+
     if is_wayland():
         # Wezterm CLI is the most reliable for terminal input
         if _type_with_wezterm_cli(text):
@@ -159,7 +173,7 @@ def _type_with_wezterm_cli(text: str) -> bool:
             check=True,
             timeout=_TYPING_TIMEOUT,
         )
-        logger.info("Typed (wezterm cli): %s%s", text[:50], "..." if len(text) > 50 else "")
+        logger.debug("Typed (wezterm cli): %.50s", text)
         return True
     except FileNotFoundError:
         return False
@@ -207,7 +221,7 @@ def _type_with_clipboard_paste(text: str) -> bool:
             timeout=_TYPING_TIMEOUT,
         )
 
-        logger.info("Typed (clipboard paste): %s%s", text[:50], "..." if len(text) > 50 else "")
+        logger.debug("Typed (clipboard paste): %.50s", text)
 
         # Restore previous clipboard after a brief delay
         if old_clipboard is not None:
@@ -230,10 +244,14 @@ def _type_with_clipboard_paste(text: str) -> bool:
 
 
 def _type_with_wtype(text: str) -> bool:
-    """Type text using wtype (Wayland-native)."""
+    """Type text using wtype (Wayland-native).
+
+    Text is piped through stdin rather than argv so long dictations never
+    approach ARG_MAX.
+    """
     try:
-        subprocess.run(["wtype", "--", text], check=True, timeout=_TYPING_TIMEOUT)
-        logger.info("Typed (wtype): %s%s", text[:50], "..." if len(text) > 50 else "")
+        subprocess.run(["wtype", "-"], input=text.encode(), check=True, timeout=_TYPING_TIMEOUT)
+        logger.debug("Typed (wtype): %.50s", text)
         return True
     except FileNotFoundError:
         return False
@@ -246,10 +264,18 @@ def _type_with_wtype(text: str) -> bool:
 
 
 def _type_with_ydotool(text: str) -> bool:
-    """Type text using ydotool (works on both Wayland and X11)."""
+    """Type text using ydotool (works on both Wayland and X11).
+
+    Text is piped through stdin rather than argv, as with wtype.
+    """
     try:
-        subprocess.run(["ydotool", "type", "--", text], check=True, timeout=_TYPING_TIMEOUT)
-        logger.info("Typed (ydotool): %s%s", text[:50], "..." if len(text) > 50 else "")
+        subprocess.run(
+            ["ydotool", "type", "--file", "-"],
+            input=text.encode(),
+            check=True,
+            timeout=_TYPING_TIMEOUT,
+        )
+        logger.debug("Typed (ydotool): %.50s", text)
         return True
     except FileNotFoundError:
         return False
@@ -269,7 +295,7 @@ def _type_with_xdotool(text: str) -> bool:
             check=True,
             timeout=_TYPING_TIMEOUT,
         )
-        logger.info("Typed (xdotool): %s%s", text[:50], "..." if len(text) > 50 else "")
+        logger.debug("Typed (xdotool): %.50s", text)
         return True
     except FileNotFoundError:
         logger.error("No typing tool found. Install wtype (Wayland) or xdotool (X11)")
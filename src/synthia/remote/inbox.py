@@ -6,12 +6,17 @@ import json
 import logging
 import os
 import uuid
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of items kept in the inbox (newest first)
+_MAX_ITEMS = 50
+
 
 def get_inbox_dir() -> Path:
     """Get the inbox directory, creating it if necessary."""
@@ -56,7 +61,7 @@ def save_inbox(items: list[dict[str, Any]]) -> None:
         logger.warning("Failed to save inbox: %s", e)
 
 
-def add_inbox_item(
+def _new_item(
     item_type: str,
     filename: str,
     path: Optional[str] = None,
@@ -64,10 +69,8 @@ def add_inbox_item(
     size_bytes: Optional[int] = None,
     from_user: Optional[str] = None,
 ) -> dict[str, Any]:
-    """Add a new item to the inbox."""
-    items = load_inbox()
-
-    item = {
+    """Build a new, unopened inbox item record."""
+    return {
         "id": str(uuid.uuid4()),
         "type": item_type,
         "filename": filename,
@@ -79,13 +82,45 @@ def add_inbox_item(
         "opened": False,
     }
 
-    items.insert(0, item)
-
-    # Keep only last 50 items
-    items = items[:50]
 
-    save_inbox(items)
-    return item
+def add_inbox_item(
+    item_type: str,
+    filename: str,
+    path: Optional[str] = None,
+    url: Optional[str] = None,
+    size_bytes: Optional[int] = None,
+    from_user: Optional[str] = None,
+) -> dict[str, Any]:
+    """Add a new item to the inbox."""
+    return add_inbox_items(
+        [
+            {
+                "item_type": item_type,
+                "filename": filename,
+                "path": path,
+                "url": url,
+                "size_bytes": size_bytes,
+                "from_user": from_user,
+            }
+        ]
+    )[0]
+
+
+def add_inbox_items(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Add several items to the inbox with a single load and save.
+
+    Each entry takes the keyword arguments of add_inbox_item. Entries are
+    added in order, so the last one ends up first (newest).
+    """
+    items = deque(islice(load_inbox(), _MAX_ITEMS), maxlen=_MAX_ITEMS)
+
+    new_items = [_new_item(**entry) for entry in entries]
+
+    # Bounded deque evicts the oldest item once the inbox is full
+    items.extendleft(new_items)
+
+    save_inbox(list(items))
+    return new_items
 
 
 def mark_item_opened(item_id: str) -> None:
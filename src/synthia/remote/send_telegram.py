@@ -22,17 +22,35 @@ from synthia.config import load_config
 # Use XDG_RUNTIME_DIR for secure temp files (not world-readable /tmp)
 REMOTE_MODE_FILE = os.path.join(os.environ.get("XDG_RUNTIME_DIR", "/tmp"), "synthia-remote-mode")
 
+# sendMessage endpoint, built once from the bot token on first use
+_SEND_URL: str | None = None
 
-def is_remote_mode():
-    """Check if remote mode is enabled."""
-    return os.path.exists(REMOTE_MODE_FILE)
+# Shared HTTP session so repeated sends reuse the TLS connection
+_SESSION = requests.Session()
 
 
-def get_chat_id():
-    """Get the chat ID for remote notifications."""
+def _get_send_url() -> str | None:
+    """Get the cached sendMessage URL, or None if no bot token is configured."""
+    global _SEND_URL
+    if _SEND_URL is None:
+        bot_token = load_config().get("telegram_bot_token")
+        if not bot_token:
+            return None
+        _SEND_URL = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+    return _SEND_URL
+
+
+def _read_chat_id() -> int | None:
+    """Read the remote-mode chat ID, or None when remote mode is off.
+
+    The remote-mode file only exists while remote mode is enabled, so a
+    single open() answers both questions.
+    """
     try:
         with open(REMOTE_MODE_FILE, "r") as f:
             return int(f.read().strip())
+    except FileNotFoundError:
+        return None
     except (IOError, ValueError) as e:
         logger.debug("Could not read remote mode file: %s", e)
         return None
@@ -40,29 +58,24 @@ def get_chat_id():
 
 def send_telegram(message: str, parse_mode: str | None = None):
     """Send a message via Telegram bot."""
-    if not is_remote_mode():
+    chat_id = _read_chat_id()
+    if chat_id is None:
         return False
 
-    chat_id = get_chat_id()
-    if not chat_id:
-        return False
-
-    config = load_config()
-    bot_token = config.get("telegram_bot_token")
-
-    if not bot_token:
+    url = _get_send_url()
+    if not url:
         return False
 
     try:
-        url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-        data = {
+        # Form-encoded body: Telegram accepts it and it skips json.dumps
+        data: dict[str, str | int] = {
             "chat_id": chat_id,
             "text": message,
         }
         if parse_mode:
             data["parse_mode"] = parse_mode
 
-        response = requests.post(url, json=data, timeout=10)
+        response = _SESSION.post(url, data=data, timeout=10)
         return response.status_code == 200
     except Exception as e:
         logger.error("Telegram send error: %s", e)
@@ -81,7 +94,7 @@ def main():
     if len(sys.argv) > 2 and sys.argv[2] in ["Markdown", "HTML"]:
         parse_mode = sys.argv[2]
 
-    if is_remote_mode():
+    if os.path.exists(REMOTE_MODE_FILE):
         success = send_telegram(message, parse_mode)
         if success:
             print("Sent to Telegram")
@@ -10,12 +10,14 @@ Features:
 """
 
 import asyncio
+import atexit
 import logging
 import os
+import random
 import re
+import secrets
 import subprocess
 import sys
-import tempfile
 import time
 from datetime import datetime
 from pathlib import Path
@@ -26,13 +28,52 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 
 # Security: Input sanitization for text sent to terminal
 MAX_MESSAGE_LENGTH = 2000  # Limit message length
-DANGEROUS_SEQUENCES = [
-    "\x1b",  # Escape sequences
-    "\x00",  # Null bytes
-    "\x07",  # Bell
-    "\x08",  # Backspace
-    "\x7f",  # Delete
-]
+
+# str.translate table deleting C0 control characters (escape, null, bell,
+# backspace, ...) except tab and newline, plus DEL
+_CTRL_TABLE = dict.fromkeys([c for c in range(32) if c not in (9, 10)] + [0x7F])
+
+# Compiled once at import for the per-message hot paths
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*[a-zA-Z]")
+_URL_RE = re.compile(r"https?://[^\s]+")
+
+# wmctrl window titles never targeted when sending to Claude Code
+_DESKTOP_PREFIXES = ("@!", "N/A")
+_SKIP_BROWSERS = ("Chrome", "Firefox", "Zen", "Brave")
+
+# Replies that approve a plan Claude Code is waiting on
+_APPROVAL_WORDS = frozenset(
+    {
+        "yes",
+        "go",
+        "approved",
+        "proceed",
+        "do it",
+        "ok",
+        "okay",
+        "yep",
+        "yeah",
+        "sure",
+        "continue",
+        "execute",
+        "run it",
+        "go ahead",
+    }
+)
+
+# Varied acknowledgements while forwarding a message to Claude Code
+_PROCESSING_MSGS = (
+    "📤 Sending to Claude Code...",
+    "⏳ Processing, please wait...",
+    "🚀 Sending now...",
+    "📨 Forwarding to Claude...",
+)
+_SENDING_MSGS = (
+    "📤 Sending to Claude Code...",
+    "🚀 Forwarding to Claude...",
+    "📨 Sending now...",
+    "⏳ Processing, please wait...",
+)
 
 
 def sanitize_terminal_input(text: str) -> str:
@@ -47,15 +88,11 @@ def sanitize_terminal_input(text: str) -> str:
     # Truncate to max length
     text = text[:MAX_MESSAGE_LENGTH]
 
-    # Remove dangerous control characters
-    for seq in DANGEROUS_SEQUENCES:
-        text = text.replace(seq, "")
-
-    # Remove ANSI escape sequences
-    text = re.sub(r"\x1b\[[0-9;]*[a-zA-Z]", "", text)
+    # Remove ANSI escape sequences (before their ESC byte is stripped below)
+    text = _ANSI_RE.sub("", text)
 
-    # Remove other control characters (except newline, tab)
-    text = "".join(char for char in text if char == "\n" or char == "\t" or ord(char) >= 32)
+    # Remove control characters (except newline, tab) in a single C-level pass
+    text = text.translate(_CTRL_TABLE)
 
     return text.strip()
 
@@ -74,8 +111,17 @@ try:
 except ImportError:
     HAS_TELEGRAM = False
 
+try:
+    import pynvml
+
+    HAS_NVML = True
+except ImportError:
+    HAS_NVML = False
+
 from synthia.assistant import Assistant
+from synthia.commands import copy_to_clipboard, get_clipboard
 from synthia.config import load_config
+from synthia.remote.inbox import add_inbox_item, add_inbox_items, get_files_dir
 from synthia.transcribe import Transcriber
 
 # Use XDG_RUNTIME_DIR for secure temp files (user-only access, not world-readable /tmp)
@@ -84,6 +130,17 @@ REMOTE_MODE_FILE = os.path.join(_RUNTIME_DIR, "synthia-remote-mode")
 WAITING_APPROVAL_FILE = os.path.join(_RUNTIME_DIR, "synthia-waiting-approval")
 PLAN_APPROVED_FILE = os.path.join(_RUNTIME_DIR, "synthia-plan-approved")
 
+# Freshness windows (seconds) for cached system stats
+_GPU_CACHE_TTL = 2.0
+_STATUS_CACHE_TTL = 5.0
+_PROCESS_CACHE_TTL = 1.0
+
+# Local address and port the webhook server listens on. It speaks plain HTTP,
+# so a TLS-terminating tunnel/reverse proxy is expected in front; loopback by
+# default, set WEBHOOK_LISTEN=0.0.0.0 only if the proxy runs on another host.
+WEBHOOK_LISTEN = os.environ.get("WEBHOOK_LISTEN", "127.0.0.1")
+WEBHOOK_PORT = 8443
+
 # Set up logging
 logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO
@@ -91,13 +148,107 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+async def _run_bytes(
+    cmd: list[str],
+    input: bytes | None = None,
+    env: dict[str, str] | None = None,
+    check: bool = True,
+    timeout: float | None = None,
+) -> bytes:
+    """Run a command without blocking the event loop and return its raw stdout.
+
+    Mirrors subprocess.check_output: raises CalledProcessError on a non-zero
+    exit (unless check is False) and TimeoutExpired if timeout elapses.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE if input is not None else None,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=env,
+    )
+    try:
+        out, err = await asyncio.wait_for(proc.communicate(input), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout or 0)
+    if check and proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode or 1, cmd, out, err)
+    return out
+
+
+async def _run(
+    cmd: list[str],
+    env: dict[str, str] | None = None,
+    check: bool = True,
+    timeout: float | None = None,
+) -> str:
+    """Run a command without blocking the event loop and return its decoded stdout."""
+    return (await _run_bytes(cmd, env=env, check=check, timeout=timeout)).decode()
+
+
+def _human_bytes(n: float) -> str:
+    """Format a byte count like `free -h` (e.g. 7.6G)."""
+    for unit in ("B", "K", "M", "G"):
+        if n < 1024:
+            return f"{n:.1f}{unit}" if unit != "B" else f"{int(n)}B"
+        n /= 1024
+    return f"{n:.1f}T"
+
+
+def _format_uptime(seconds: float) -> str:
+    """Format uptime seconds like `uptime -p` (e.g. up 2 days, 3 hours, 5 minutes)."""
+    minutes = int(seconds) // 60
+    days, minutes = divmod(minutes, 24 * 60)
+    hours, minutes = divmod(minutes, 60)
+    parts = []
+    for value, unit in ((days, "day"), (hours, "hour"), (minutes, "minute")):
+        if value:
+            parts.append(f"{value} {unit}" + ("s" if value != 1 else ""))
+    return "up " + (", ".join(parts) or "0 minutes")
+
+
+def _read_meminfo() -> tuple[str, str]:
+    """Return (used, total) memory from /proc/meminfo, formatted for display."""
+    fields = {}
+    with open("/proc/meminfo") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in ("MemTotal", "MemAvailable"):
+                fields[key] = int(value.split()[0]) * 1024
+    total = fields["MemTotal"]
+    used = total - fields["MemAvailable"]
+    return _human_bytes(used), _human_bytes(total)
+
+
+def _process_cmdline_matches(name: str) -> bool:
+    """Return True if any process command line contains name (like `pgrep -f`).
+
+    Scans /proc directly and stops at the first match, so no process is forked.
+    """
+    needle = name.encode()
+    with os.scandir("/proc") as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry.name}/cmdline", "rb") as f:
+                    cmdline = f.read()
+            except OSError:
+                continue  # Process exited or is inaccessible
+            if needle in cmdline.replace(b"\0", b" "):
+                return True
+    return False
+
+
 class SynthiaBot:
     """Telegram bot for remote Synthia access."""
 
     def __init__(self, bot_token: str, allowed_users: list):
         self.bot_token = bot_token
         self.allowed_users = allowed_users
-        self.app = None
+        self.app: Application | None = None
 
         # Load config and initialize components
         self.config = load_config()
@@ -114,6 +265,22 @@ class SynthiaBot:
             ollama_url=self.config.get("ollama_url", "http://localhost:11434"),
         )
 
+        # (time.monotonic() timestamp, value) caches for re-queried system stats
+        self._gpu_cache: tuple[float, tuple[str, ...] | None] = (0.0, None)
+        self._status_cache: tuple[float, str | None] = (0.0, None)
+        self._process_cache: dict[str, tuple[float, bool]] = {}
+
+        # Remote-mode file state, refreshed only when its mtime changes
+        self._remote_mtime = -1
+        self._remote_chat_id: int | None = None
+
+        # Display server details resolved on first send to Claude Code
+        self._wayland: bool | None = None
+        self._display: str | None = None
+
+        # Query GPU stats via NVML when available (falls back to nvidia-smi)
+        self._nvml = self._init_nvml()
+
         logger.info("Synthia Bot initialized")
 
     def is_authorized(self, user_id: int) -> bool:
@@ -155,38 +322,45 @@ class SynthiaBot:
             return
 
         try:
-            # Get uptime
-            uptime = subprocess.check_output(["uptime", "-p"], text=True).strip()
-
-            # Get load average
-            load = subprocess.check_output(["cat", "/proc/loadavg"], text=True).split()[:3]
-            load_str = ", ".join(load)
-
-            # Get memory
-            mem = subprocess.check_output(["free", "-h"], text=True).split("\n")[1].split()
-            mem_used, mem_total = mem[2], mem[1]
-
-            # Check if Ollama is running
-            ollama_status = "Running" if self._is_process_running("ollama") else "Stopped"
-
-            # Check if Synthia main is running
-            synthia_status = "Running" if self._is_process_running("synthia") else "Stopped"
-
-            status_msg = (
-                f"*System Status*\n\n"
-                f"Uptime: {uptime}\n"
-                f"Load: {load_str}\n"
-                f"Memory: {mem_used} / {mem_total}\n\n"
-                f"*Services*\n"
-                f"Synthia: {synthia_status}\n"
-                f"Ollama: {ollama_status}"
-            )
-
+            status_msg = await self._get_status_message()
             await update.message.reply_text(status_msg, parse_mode="Markdown")
 
         except Exception as e:
             await update.message.reply_text(f"Error getting status: {e}")
 
+    async def _get_status_message(self) -> str:
+        """Build the /status message, reusing it for a few seconds."""
+        cached_at, cached = self._status_cache
+        if cached is not None and time.monotonic() - cached_at < _STATUS_CACHE_TTL:
+            return cached
+
+        # Read uptime, load and memory straight from /proc (no fork per stat)
+        with open("/proc/uptime") as f:
+            uptime = _format_uptime(float(f.read().split()[0]))
+
+        with open("/proc/loadavg") as f:
+            load_str = ", ".join(f.read().split()[:3])
+
+        mem_used, mem_total = _read_meminfo()
+
+        # Check if Ollama is running
+        ollama_status = "Running" if await self._is_process_running("ollama") else "Stopped"
+
+        # Check if Synthia main is running
+        synthia_status = "Running" if await self._is_process_running("synthia") else "Stopped"
+
+        status_msg = (
+            f"*System Status*\n\n"
+            f"Uptime: {uptime}\n"
+            f"Load: {load_str}\n"
+            f"Memory: {mem_used} / {mem_total}\n\n"
+            f"*Services*\n"
+            f"Synthia: {synthia_status}\n"
+            f"Ollama: {ollama_status}"
+        )
+        self._status_cache = (time.monotonic(), status_msg)
+        return status_msg
+
     async def disk(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /disk command - show disk usage."""
         assert update.effective_user is not None
@@ -196,7 +370,7 @@ class SynthiaBot:
             return
 
         try:
-            df = subprocess.check_output(["df", "-h", "/"], text=True).split("\n")[1].split()
+            df = (await _run(["df", "-h", "/"])).split("\n")[1].split()
             used, total, percent = df[2], df[1], df[4]
 
             await update.message.reply_text(
@@ -214,16 +388,7 @@ class SynthiaBot:
             return
 
         try:
-            gpu_info = subprocess.check_output(
-                [
-                    "nvidia-smi",
-                    "--query-gpu=name,memory.used,memory.total,utilization.gpu,temperature.gpu",
-                    "--format=csv,noheader,nounits",
-                ],
-                text=True,
-            ).strip()
-
-            name, mem_used, mem_total, util, temp = gpu_info.split(", ")
+            name, mem_used, mem_total, util, temp = await self._get_gpu_stats()
 
             await update.message.reply_text(
                 f"*GPU Status*\n\n"
@@ -236,6 +401,58 @@ class SynthiaBot:
         except Exception as e:
             await update.message.reply_text(f"Error: {e}")
 
+    def _init_nvml(self) -> bool:
+        """Initialise NVML once; returns False if the library or driver is missing."""
+        if not HAS_NVML:
+            return False
+        try:
+            pynvml.nvmlInit()
+        except Exception as e:
+            logger.debug("NVML unavailable, using nvidia-smi: %s", e)
+            return False
+        atexit.register(pynvml.nvmlShutdown)
+        return True
+
+    def _read_nvml_stats(self) -> tuple[str, ...]:
+        """Read GPU 0 stats through NVML, formatted like nvidia-smi's nounits CSV."""
+        handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+        name = pynvml.nvmlDeviceGetName(handle)
+        if isinstance(name, bytes):
+            name = name.decode()
+        mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+        util = pynvml.nvmlDeviceGetUtilizationRates(handle).gpu
+        temp = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
+        mib = 1024 * 1024
+        return (name, str(mem.used // mib), str(mem.total // mib), str(util), str(temp))
+
+    async def _get_gpu_stats(self) -> tuple[str, ...]:
+        """Query (name, mem used, mem total, util, temp) for GPU 0, cached briefly."""
+        cached_at, cached = self._gpu_cache
+        if cached is not None and time.monotonic() - cached_at < _GPU_CACHE_TTL:
+            return cached
+
+        if self._nvml:
+            try:
+                stats = self._read_nvml_stats()
+                self._gpu_cache = (time.monotonic(), stats)
+                return stats
+            except Exception as e:
+                logger.debug("NVML query failed, using nvidia-smi: %s", e)
+
+        gpu_info = (
+            await _run(
+                [
+                    "nvidia-smi",
+                    "--query-gpu=name,memory.used,memory.total,utilization.gpu,temperature.gpu",
+                    "--format=csv,noheader,nounits",
+                ]
+            )
+        ).strip()
+
+        stats = tuple(gpu_info.split(", "))
+        self._gpu_cache = (time.monotonic(), stats)
+        return stats
+
     async def screenshot(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /screenshot command - take and send screenshot."""
         assert update.effective_user is not None
@@ -251,23 +468,22 @@ class SynthiaBot:
             screenshot_path = os.path.join(_RUNTIME_DIR, "synthia_screenshot.png")
 
             # Try gnome-screenshot first, fall back to scrot
+            env = {**os.environ, "DISPLAY": ":0"}
             try:
-                subprocess.run(
-                    ["gnome-screenshot", "-f", screenshot_path],
-                    check=True,
-                    env={**os.environ, "DISPLAY": ":0"},
-                )
-            except FileNotFoundError:
-                subprocess.run(
-                    ["scrot", screenshot_path], check=True, env={**os.environ, "DISPLAY": ":0"}
-                )
-
-            # Send the screenshot
-            with open(screenshot_path, "rb") as photo:
-                await update.message.reply_photo(photo)
-
-            # Clean up
-            os.remove(screenshot_path)
+                try:
+                    await _run(["gnome-screenshot", "-f", screenshot_path], env=env)
+                except FileNotFoundError:
+                    await _run(["scrot", screenshot_path], env=env)
+
+                # Send the screenshot
+                with open(screenshot_path, "rb") as photo:
+                    await update.message.reply_photo(photo)
+            finally:
+                # Clean up even if capture or upload failed
+                try:
+                    os.remove(screenshot_path)
+                except FileNotFoundError:
+                    pass
 
         except Exception as e:
             await update.message.reply_text(f"Screenshot failed: {e}")
@@ -286,8 +502,6 @@ class SynthiaBot:
             return
 
         try:
-            from synthia.commands import copy_to_clipboard
-
             success = copy_to_clipboard(text)
 
             if success:
@@ -309,8 +523,6 @@ class SynthiaBot:
             return
 
         try:
-            from synthia.commands import get_clipboard
-
             content = get_clipboard()
 
             if content:
@@ -334,8 +546,6 @@ class SynthiaBot:
             return
 
         try:
-            from synthia.remote.inbox import add_inbox_item, get_files_dir
-
             doc = update.message.document
             assert doc is not None
             file = await doc.get_file()
@@ -348,7 +558,8 @@ class SynthiaBot:
             if not safe_name or safe_name.startswith("."):
                 safe_name = f"upload_{int(time.time())}"
             file_path = files_dir / safe_name
-            await file.download_to_drive(str(file_path))
+            data = await file.download_as_bytearray()
+            await asyncio.to_thread(file_path.write_bytes, data)
 
             # Add to inbox
             add_inbox_item(
@@ -372,10 +583,6 @@ class SynthiaBot:
             return
 
         try:
-            from datetime import datetime
-
-            from synthia.remote.inbox import add_inbox_item, get_files_dir
-
             # Get largest photo
             photo = update.message.photo[-1]
             file = await photo.get_file()
@@ -385,7 +592,8 @@ class SynthiaBot:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"photo_{timestamp}.jpg"
             file_path = files_dir / filename
-            await file.download_to_drive(str(file_path))
+            data = await file.download_as_bytearray()
+            await asyncio.to_thread(file_path.write_bytes, data)
 
             # Add to inbox
             add_inbox_item(
@@ -413,62 +621,45 @@ class SynthiaBot:
             return
         logger.info(f"Received text: {text}")
 
+        remote_mode = self._is_remote_mode()
+
         # Check for URLs and save to inbox (only if not in remote mode)
-        if not self._is_remote_mode():
-            url_pattern = r"https?://[^\s]+"
-            urls = re.findall(url_pattern, text)
+        if not remote_mode:
+            urls = _URL_RE.findall(text)
             if urls:
-                from synthia.remote.inbox import add_inbox_item
-
-                for url in urls:
-                    add_inbox_item(
-                        item_type="url",
-                        filename=url[:60] + "..." if len(url) > 60 else url,
-                        url=url,
-                        from_user=update.effective_user.first_name,
-                    )
+                from_user = update.effective_user.first_name
+                entries = [
+                    {
+                        "item_type": "url",
+                        "filename": url[:60] + "..." if len(url) > 60 else url,
+                        "url": url,
+                        "from_user": from_user,
+                    }
+                    for url in urls
+                ]
+                await asyncio.to_thread(add_inbox_items, entries)
                 await update.message.reply_text(f"Saved {len(urls)} URL(s) to inbox")
                 # If the message is just URL(s), don't process further
-                text_without_urls = re.sub(url_pattern, "", text).strip()
+                text_without_urls = _URL_RE.sub("", text).strip()
                 if not text_without_urls:
                     return
 
         # If in remote mode, send to Claude Code instead of local LLM
-        if self._is_remote_mode():
-            import random
-
+        if remote_mode:
             # Check if Claude is waiting for approval
             waiting_for_approval = os.path.exists(WAITING_APPROVAL_FILE)
 
             if waiting_for_approval:
                 # Check if this is an approval message
-                approval_words = [
-                    "yes",
-                    "go",
-                    "approved",
-                    "proceed",
-                    "do it",
-                    "ok",
-                    "okay",
-                    "yep",
-                    "yeah",
-                    "sure",
-                    "continue",
-                    "execute",
-                    "run it",
-                    "go ahead",
-                ]
-                if (
-                    text.lower().strip() in approval_words
-                    or text.lower().strip().rstrip("!.") in approval_words
-                ):
+                norm = text.lower().strip()
+                if norm in _APPROVAL_WORDS or norm.rstrip("!.") in _APPROVAL_WORDS:
                     # Send approval signal
                     os.remove(WAITING_APPROVAL_FILE)
                     with open(PLAN_APPROVED_FILE, "w") as f:
                         f.write("approved")
                     await update.message.reply_text("✅ Approved! Executing plan...")
                     # Send "proceed" to Claude Code
-                    self._send_to_claude_code("proceed with the plan")
+                    await self._send_to_claude_code("proceed with the plan")
                     return
                 else:
                     # New request while waiting - cancel old plan
@@ -477,23 +668,20 @@ class SynthiaBot:
                         "📝 New request received, cancelling previous plan..."
                     )
 
-            # Varied processing messages
-            processing_msgs = [
-                "📤 Sending to Claude Code...",
-                "⏳ Processing, please wait...",
-                "🚀 Sending now...",
-                "📨 Forwarding to Claude...",
-            ]
-            await update.message.reply_text(random.choice(processing_msgs))
-
-            success = self._send_to_claude_code(text)
+            # Acknowledge (varied message) while the text is being typed
+            _, success = await asyncio.gather(
+                update.message.reply_text(
+                    _PROCESSING_MSGS[random.randrange(len(_PROCESSING_MSGS))]
+                ),
+                self._send_to_claude_code(text),
+            )
             if not success:
                 await update.message.reply_text("❌ Failed to send. Is WezTerm running?")
             return
 
         try:
             # Process with local assistant
-            response = self.assistant.process(text)
+            response = await asyncio.to_thread(self.assistant.process, text)
 
             # Extract the spoken response (key is 'speech' not 'response')
             reply = response.get("speech", "Sorry, I could not process that.")
@@ -505,27 +693,31 @@ class SynthiaBot:
             await update.message.reply_text(f"Error: {e}")
 
     def _is_wayland(self) -> bool:
-        """Check if running on Wayland."""
-        return bool(os.environ.get("WAYLAND_DISPLAY"))
+        """Check if running on Wayland (detected once per bot lifetime)."""
+        if self._wayland is None:
+            self._wayland = bool(os.environ.get("WAYLAND_DISPLAY"))
+        return self._wayland
 
-    def _get_display(self) -> str:
-        """Get the active X display, trying common options."""
+    async def _get_display(self) -> str:
+        """Get the active X display, trying common options.
+
+        The probe result is cached; _send_x11 clears it when targeting fails.
+        """
+        if self._display is not None:
+            return self._display
         for display in [":1", ":0"]:
             try:
-                result = subprocess.run(
-                    ["wmctrl", "-l"],
-                    capture_output=True,
-                    text=True,
-                    env={**os.environ, "DISPLAY": display},
-                    timeout=2,
+                windows = await _run(
+                    ["wmctrl", "-l"], env={**os.environ, "DISPLAY": display}, timeout=2
                 )
-                if result.returncode == 0 and result.stdout.strip():
+                if windows.strip():
+                    self._display = display
                     return display
             except Exception:
                 pass
         return os.environ.get("DISPLAY", ":0")
 
-    def _send_to_claude_code(self, message: str) -> bool:
+    async def _send_to_claude_code(self, message: str) -> bool:
         """Send a message to the Claude Code terminal.
 
         On Wayland: Uses wtype to type to the focused window.
@@ -542,24 +734,28 @@ class SynthiaBot:
         try:
             # Use Wayland-native approach if available
             if self._is_wayland():
-                return self._send_wayland(message)
+                return await self._send_wayland(message)
             else:
-                return self._send_x11(message)
+                return await self._send_x11(message)
 
         except Exception as e:
             logger.error(f"Error sending to Claude Code: {e}")
             return False
 
-    def _send_wayland(self, message: str) -> bool:
+    async def _send_wayland(self, message: str) -> bool:
         """Send message using Wayland tools (wtype or ydotool)."""
         # Try ydotool first (works even without focus on the window)
         try:
-            # Check if ydotoold is running
-            result = subprocess.run(["pgrep", "-x", "ydotoold"], capture_output=True)
-            if result.returncode == 0:
+            # Check if ydotoold is running (pgrep exits non-zero when it isn't)
+            try:
+                await _run(["pgrep", "-x", "ydotoold"])
+                ydotoold_running = True
+            except subprocess.CalledProcessError:
+                ydotoold_running = False
+            if ydotoold_running:
                 # ydotool is available and daemon is running
-                subprocess.run(["ydotool", "type", "--", message], check=True)
-                subprocess.run(["ydotool", "key", "enter"], check=True)
+                # Trailing newline presses Enter in the same invocation
+                await _run(["ydotool", "type", "--", message + "\n"])
                 logger.info(f"Sent via ydotool: {message}")
                 return True
         except FileNotFoundError:
@@ -568,8 +764,8 @@ class SynthiaBot:
         # Fallback to wtype (requires the terminal to be focused)
         try:
             # wtype types to the currently focused window
-            subprocess.run(["wtype", message], check=True)
-            subprocess.run(["wtype", "-k", "Return"], check=True)
+            # wtype processes text and -k key presses in order in one call
+            await _run(["wtype", message, "-k", "Return"])
             logger.info(f"Sent via wtype: {message}")
             return True
         except FileNotFoundError:
@@ -579,66 +775,64 @@ class SynthiaBot:
             logger.error(f"wtype failed: {e}")
             return False
 
-    def _send_x11(self, message: str) -> bool:
+    async def _send_x11(self, message: str) -> bool:
         """Send message using X11 tools (xdotool with window targeting)."""
-        display = self._get_display()
+        display = await self._get_display()
+        env = {**os.environ, "DISPLAY": display}
 
         # Find terminal window - look for "Remote" tab in WezTerm
-        result = subprocess.run(
-            ["wmctrl", "-l"], capture_output=True, text=True, env={**os.environ, "DISPLAY": display}
-        )
+        windows = await _run(["wmctrl", "-l"], env=env, check=False)
 
         # Priority order for window matching:
         # 1. Window titled "Remote" (dedicated remote control tab)
         # 2. Window with Claude Code indicator (✳ or Claude)
         # 3. WezTerm windows (contain tab info like [1/4])
         window_id = None
-        candidates: list[tuple[str, str]] = []
-        for line in result.stdout.strip().split("\n"):
+        remote: tuple[str, str] | None = None
+        claude: tuple[str, str] | None = None
+        wezterm: tuple[str, str] | None = None
+        for line in windows.splitlines():
             parts = line.split(None, 4)
             if len(parts) >= 4:
                 wid = parts[0]
                 title = parts[-1] if len(parts) > 4 else ""
                 # Skip empty titles and desktop/panel windows
-                if not title or title.startswith("@!") or title.startswith("N/A"):
+                if not title or title.startswith(_DESKTOP_PREFIXES):
                     continue
                 # Skip browser windows (Chrome, Firefox, etc)
-                if any(x in title for x in ["Chrome", "Firefox", "Zen", "Brave"]):
+                if any(x in title for x in _SKIP_BROWSERS):
                     continue
-                # Highest priority - "Remote" tab
+                # Highest priority - "Remote" tab (last one listed wins)
                 if title == "Remote":
-                    candidates.insert(0, (wid, title))
-                # High priority - Claude Code window (has ✳ indicator)
+                    remote = (wid, title)
+                # High priority - Claude Code window (has ✳ indicator, last one wins)
                 elif "✳" in title:
-                    candidates.insert(
-                        1 if candidates and candidates[0][1] == "Remote" else 0, (wid, title)
-                    )
-                # Medium priority - WezTerm with tab indicator [X/Y]
-                elif title.startswith("[") and "/" in title[:6]:
-                    candidates.append((wid, title))
-
-        if candidates:
-            wid, title = candidates[0]
+                    claude = (wid, title)
+                # Medium priority - WezTerm with tab indicator [X/Y] (first one wins)
+                elif wezterm is None and title.startswith("[") and "/" in title[:6]:
+                    wezterm = (wid, title)
+
+        best = remote or claude or wezterm
+        if best:
+            wid, title = best
             window_id = str(int(wid, 16))
             logger.info(f"Found terminal window: {title} ({wid})")
 
         if not window_id:
             logger.error("No terminal window found")
+            self._display = None  # Re-probe displays next time
             return False
 
-        # Type the message into the terminal
-        subprocess.run(
-            ["xdotool", "type", "--window", window_id, "--clearmodifiers", message],
-            check=True,
-            env={**os.environ, "DISPLAY": display},
-        )
-
-        # Press Enter
-        subprocess.run(
-            ["xdotool", "key", "--window", window_id, "Return"],
-            check=True,
-            env={**os.environ, "DISPLAY": display},
-        )
+        try:
+            # Type the message into the terminal; the trailing newline is
+            # typed as Return, so one xdotool call both types and submits
+            await _run(
+                ["xdotool", "type", "--window", window_id, "--clearmodifiers", message + "\n"],
+                env=env,
+            )
+        except subprocess.CalledProcessError:
+            self._display = None  # Display may have changed; re-probe next time
+            raise
 
         logger.info(f"Sent via xdotool: {message}")
         return True
@@ -655,34 +849,31 @@ class SynthiaBot:
         try:
             await update.message.reply_text("🎤 Listening...")
 
-            # Download voice file
+            # Download voice note into memory
             voice = await update.message.voice.get_file()
+            ogg_bytes = bytes(await voice.download_as_bytearray())
 
-            # Create temp file for the voice note
-            with tempfile.NamedTemporaryFile(suffix=".ogg", delete=False) as f:
-                ogg_path = f.name
-
-            await voice.download_to_drive(ogg_path)
-
-            # Convert to WAV for Whisper
-            wav_path = ogg_path.replace(".ogg", ".wav")
-            subprocess.run(
-                ["ffmpeg", "-i", ogg_path, "-ar", "16000", "-ac", "1", wav_path, "-y"],
-                check=True,
-                capture_output=True,
+            # Decode OGG to raw 16kHz mono PCM for Whisper, entirely over pipes
+            audio_data = await _run_bytes(
+                [
+                    "ffmpeg",
+                    "-hide_banner",
+                    "-loglevel",
+                    "error",
+                    "-i",
+                    "pipe:0",
+                    "-f",
+                    "s16le",
+                    "-ar",
+                    "16000",
+                    "-ac",
+                    "1",
+                    "pipe:1",
+                ],
+                input=ogg_bytes,
             )
 
-            # Read WAV and transcribe
-            with open(wav_path, "rb") as f:
-                # Skip WAV header (44 bytes) and read PCM data
-                f.seek(44)
-                audio_data = f.read()
-
-            transcript = self.transcriber.transcribe(audio_data)
-
-            # Clean up temp files
-            os.remove(ogg_path)
-            os.remove(wav_path)
+            transcript = await asyncio.to_thread(self.transcriber.transcribe, audio_data)
 
             if not transcript:
                 await update.message.reply_text("Couldn't understand that. Try again?")
@@ -690,18 +881,11 @@ class SynthiaBot:
 
             # If in remote mode, send to Claude Code
             if self._is_remote_mode():
-                # Varied sending messages
-                import random
-
-                sending_msgs = [
-                    "📤 Sending to Claude Code...",
-                    "🚀 Forwarding to Claude...",
-                    "📨 Sending now...",
-                    "⏳ Processing, please wait...",
-                ]
-                await update.message.reply_text(random.choice(sending_msgs))
-
-                success = self._send_to_claude_code(transcript)
+                # Acknowledge (varied message) while the transcript is being typed
+                _, success = await asyncio.gather(
+                    update.message.reply_text(_SENDING_MSGS[random.randrange(len(_SENDING_MSGS))]),
+                    self._send_to_claude_code(transcript),
+                )
                 if not success:
                     await update.message.reply_text("❌ Failed to send. Is WezTerm running?")
                 return
@@ -710,7 +894,7 @@ class SynthiaBot:
             await update.message.reply_text(f"Heard: _{transcript}_", parse_mode="Markdown")
 
             # Process with assistant
-            response = self.assistant.process(transcript)
+            response = await asyncio.to_thread(self.assistant.process, transcript)
             reply = response.get("speech", "Sorry, I could not process that.")
 
             await update.message.reply_text(reply)
@@ -719,25 +903,42 @@ class SynthiaBot:
             logger.error(f"Error processing voice: {e}")
             await update.message.reply_text(f"Error: {e}")
 
-    def _is_process_running(self, name: str) -> bool:
-        """Check if a process is running."""
+    async def _is_process_running(self, name: str) -> bool:
+        """Check if a process is running (result cached for a second)."""
+        cached = self._process_cache.get(name)
+        if cached is not None and time.monotonic() - cached[0] < _PROCESS_CACHE_TTL:
+            return cached[1]
+
+        running = _process_cmdline_matches(name)
+        self._process_cache[name] = (time.monotonic(), running)
+        return running
+
+    def _refresh_remote_mode(self) -> None:
+        """Re-read the remote-mode file only if its mtime has changed."""
         try:
-            subprocess.check_output(["pgrep", "-f", name])
-            return True
-        except subprocess.CalledProcessError:
-            return False
+            mtime = os.stat(REMOTE_MODE_FILE).st_mtime_ns
+        except FileNotFoundError:
+            mtime = -1
+        if mtime == self._remote_mtime:
+            return
+        self._remote_mtime = mtime
+        self._remote_chat_id = None
+        if mtime != -1:
+            try:
+                with open(REMOTE_MODE_FILE, "r") as f:
+                    self._remote_chat_id = int(f.read().strip())
+            except Exception:
+                pass
 
     def _is_remote_mode(self) -> bool:
         """Check if remote mode is enabled."""
-        return os.path.exists(REMOTE_MODE_FILE)
+        self._refresh_remote_mode()
+        return self._remote_mtime != -1
 
     def _get_remote_chat_id(self) -> int | None:
         """Get the chat ID for remote notifications."""
-        try:
-            with open(REMOTE_MODE_FILE, "r") as f:
-                return int(f.read().strip())
-        except Exception:
-            return None
+        self._refresh_remote_mode()
+        return self._remote_chat_id
 
     async def enable_dev_mode(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Enable Dev Mode - control Claude Code remotely."""
@@ -788,42 +989,79 @@ class SynthiaBot:
         if self.app:
             await self.app.bot.send_message(chat_id=chat_id, text=f"🔔 {message}")
 
-    def run(self):
-        """Start the bot."""
+    def run(self, webhook_url: str | None = None):
+        """Start the bot.
+
+        Long-polls Telegram by default. With webhook_url (the public HTTPS base
+        URL, e.g. from cloudflared or tailscale funnel) Telegram pushes updates
+        to a local server on WEBHOOK_LISTEN:WEBHOOK_PORT instead; this needs
+        the python-telegram-bot[webhooks] extra.
+        """
         logger.info("Starting Synthia Telegram bot...")
 
         # Build application
-        self.app = Application.builder().token(self.bot_token).build()
+        app = Application.builder().token(self.bot_token).build()
+        self.app = app
 
         # Add handlers
-        self.app.add_handler(CommandHandler("start", self.start))
-        self.app.add_handler(CommandHandler("status", self.status))
-        self.app.add_handler(CommandHandler("disk", self.disk))
-        self.app.add_handler(CommandHandler("gpu", self.gpu))
-        self.app.add_handler(CommandHandler("screenshot", self.screenshot))
-        self.app.add_handler(CommandHandler("dev", self.enable_dev_mode))
-        self.app.add_handler(CommandHandler("quick", self.enable_quick_mode))
+        app.add_handler(CommandHandler("start", self.start))
+        app.add_handler(CommandHandler("status", self.status))
+        app.add_handler(CommandHandler("disk", self.disk))
+        app.add_handler(CommandHandler("gpu", self.gpu))
+        app.add_handler(CommandHandler("screenshot", self.screenshot))
+        app.add_handler(CommandHandler("dev", self.enable_dev_mode))
+        app.add_handler(CommandHandler("quick", self.enable_quick_mode))
         # Keep old commands as aliases for backwards compatibility
-        self.app.add_handler(CommandHandler("remote", self.enable_dev_mode))
-        self.app.add_handler(CommandHandler("local", self.enable_quick_mode))
+        app.add_handler(CommandHandler("remote", self.enable_dev_mode))
+        app.add_handler(CommandHandler("local", self.enable_quick_mode))
         # Clipboard sync commands
-        self.app.add_handler(CommandHandler("clip", self.clip_command))
-        self.app.add_handler(CommandHandler("getclip", self.getclip_command))
+        app.add_handler(CommandHandler("clip", self.clip_command))
+        app.add_handler(CommandHandler("getclip", self.getclip_command))
         # Message handlers
-        self.app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_text))
-        self.app.add_handler(MessageHandler(filters.VOICE, self.handle_voice))
-        self.app.add_handler(MessageHandler(filters.Document.ALL, self.handle_document))
-        self.app.add_handler(MessageHandler(filters.PHOTO, self.handle_photo))
+        app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_text))
+        app.add_handler(MessageHandler(filters.VOICE, self.handle_voice))
+        app.add_handler(MessageHandler(filters.Document.ALL, self.handle_document))
+        app.add_handler(MessageHandler(filters.PHOTO, self.handle_photo))
 
         # Run the bot
         logger.info("Bot is ready! Listening for messages...")
-        self.app.run_polling(allowed_updates=Update.ALL_TYPES)
+        if webhook_url:
+            # Random path + secret header so only Telegram can post updates
+            secret = secrets.token_urlsafe(32)
+            app.run_webhook(
+                listen=WEBHOOK_LISTEN,
+                port=WEBHOOK_PORT,
+                url_path=secret,
+                secret_token=secret,
+                webhook_url=f"{webhook_url.rstrip('/')}/{secret}",
+                allowed_updates=Update.ALL_TYPES,
+            )
+        else:
+            app.run_polling(allowed_updates=Update.ALL_TYPES)
+
+
+async def _send_all(bot_token: str, user_ids: list, message: str) -> None:
+    """Send one message to every user concurrently over a pooled HTTP client."""
+    import httpx
+
+    url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+    async with httpx.AsyncClient(timeout=5) as client:
+        results = await asyncio.gather(
+            *(
+                client.post(
+                    url, json={"chat_id": user_id, "text": message, "parse_mode": "Markdown"}
+                )
+                for user_id in user_ids
+            ),
+            return_exceptions=True,
+        )
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.error(f"Failed to send notification: {result}")
 
 
 def send_telegram_notification(message: str):
     """Send a one-off notification to all allowed users."""
-    import requests
-
     config = load_config()
     bot_token = config.get("telegram_bot_token")
     allowed_users = config.get("telegram_allowed_users", [])
@@ -831,15 +1069,7 @@ def send_telegram_notification(message: str):
     if not bot_token or not allowed_users:
         return False
 
-    for user_id in allowed_users:
-        try:
-            url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-            requests.post(
-                url, json={"chat_id": user_id, "text": message, "parse_mode": "Markdown"}, timeout=5
-            )
-        except Exception as e:
-            logger.error(f"Failed to send notification: {e}")
-
+    asyncio.run(_send_all(bot_token, allowed_users, message))
     return True
 
 
@@ -851,6 +1081,14 @@ def main():
         send_telegram_notification(message)
         return
 
+    # Optional webhook mode: --webhook <public_url>
+    webhook_url = None
+    if len(sys.argv) > 1 and sys.argv[1] == "--webhook":
+        if len(sys.argv) < 3:
+            print("Usage: telegram_bot.py --webhook <public_url>")
+            sys.exit(1)
+        webhook_url = sys.argv[2]
+
     config = load_config()
 
     bot_token = config.get("telegram_bot_token")
@@ -867,7 +1105,7 @@ def main():
         sys.exit(1)
 
     bot = SynthiaBot(bot_token, allowed_users)
-    bot.run()
+    bot.run(webhook_url)
 
 
 if __name__ == "__main__":
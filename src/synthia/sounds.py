@@ -1,17 +1,16 @@
 """Sound effects for Synthia."""
 
-import atexit
+import functools
 import logging
-import os
+import queue
 import subprocess
-import tempfile
+import threading
 
 logger = logging.getLogger(__name__)
 
 # Audio constants
 BEEP_SAMPLE_RATE = 44100
 BEEP_VOLUME = 0.3
-MAX_TEMP_FILES = 10
 
 # Beep frequencies (Hz)
 FREQ_HIGH = 880  # Recording start
@@ -23,30 +22,35 @@ DURATION_SHORT = 100
 DURATION_LONG = 200
 
 
-def _generate_beep(frequency: int, duration_ms: int, volume: float = 0.5) -> bytes:
-    """Generate a simple beep as WAV bytes."""
-    import math
-    import struct
+@functools.lru_cache(maxsize=8)
+def _generate_beep_pcm(frequency: int, duration_ms: int, volume: float = 0.5) -> bytes:
+    """Generate a simple beep as raw 16-bit mono PCM (s16le).
+
+    Cached: the same few beeps are requested by every SoundEffects instance.
+    """
+    import numpy as np
 
     sample_rate = BEEP_SAMPLE_RATE
     num_samples = int(sample_rate * duration_ms / 1000)
 
     # Generate sine wave
-    samples = []
-    for i in range(num_samples):
-        t = i / sample_rate
-        # Apply envelope to avoid clicks
-        envelope = min(1.0, min(i, num_samples - i) / (sample_rate * 0.01))
-        value = int(32767 * volume * envelope * math.sin(2 * math.pi * frequency * t))
-        samples.append(struct.pack("<h", value))
-
-    audio_data = b"".join(samples)
-
-    # Create WAV header
-    wav_header = struct.pack(
+    i = np.arange(num_samples)
+    t = i / sample_rate
+    # Apply envelope to avoid clicks
+    envelope = np.minimum(1.0, np.minimum(i, num_samples - i) / (sample_rate * 0.01))
+    wave = 32767 * volume * envelope * np.sin(2 * np.pi * frequency * t)
+    return wave.astype("<i2").tobytes()
+
+
+@functools.lru_cache(maxsize=8)
+def _wav_header(data_len: int, sample_rate: int = BEEP_SAMPLE_RATE) -> bytes:
+    """Build the 44-byte header for 16-bit mono PCM of the given length."""
+    import struct
+
+    return struct.pack(
         "<4sI4s4sIHHIIHH4sI",
         b"RIFF",
-        36 + len(audio_data),
+        36 + data_len,
         b"WAVE",
         b"fmt ",
         16,  # PCM header size
@@ -57,10 +61,24 @@ def _generate_beep(frequency: int, duration_ms: int, volume: float = 0.5) -> byt
         2,  # Block align
         16,  # Bits per sample
         b"data",
-        len(audio_data),
+        data_len,
     )
 
-    return wav_header + audio_data
+
+def _generate_beep(frequency: int, duration_ms: int, volume: float = 0.5) -> bytes:
+    """Generate a simple beep as WAV bytes."""
+    audio_data = _generate_beep_pcm(frequency, duration_ms, volume)
+    return _wav_header(len(audio_data)) + audio_data
+
+
+# paplay command reading raw beep PCM from stdin
+_PAPLAY_RAW_CMD = [
+    "paplay",
+    "--raw",
+    "--format=s16le",
+    f"--rate={BEEP_SAMPLE_RATE}",
+    "--channels=1",
+]
 
 
 class SoundEffects:
@@ -68,58 +86,65 @@ class SoundEffects:
 
     def __init__(self, enabled: bool = True):
         self.enabled = enabled
-        self._temp_files: list[str] = []
-        atexit.register(self.cleanup)
 
-        # Pre-generate sounds
-        self._start_sound = _generate_beep(FREQ_HIGH, DURATION_SHORT, BEEP_VOLUME)
-        self._stop_sound = _generate_beep(FREQ_LOW, DURATION_SHORT, BEEP_VOLUME)
-        self._error_sound = _generate_beep(FREQ_ERROR, DURATION_LONG, BEEP_VOLUME)
-
-    def _play_wav(self, wav_data: bytes):
-        """Play WAV data using paplay."""
-        if not self.enabled:
-            return
+        # Pre-generate sounds as raw PCM, streamed to paplay on demand
+        self._start_pcm = _generate_beep_pcm(FREQ_HIGH, DURATION_SHORT, BEEP_VOLUME)
+        self._stop_pcm = _generate_beep_pcm(FREQ_LOW, DURATION_SHORT, BEEP_VOLUME)
+        self._error_pcm = _generate_beep_pcm(FREQ_ERROR, DURATION_LONG, BEEP_VOLUME)
+
+        # Playback requests are handed to a worker thread so callers on the
+        # recording hot path never wait on fork/exec of paplay
+        self._queue: queue.Queue[bytes] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        # play_* is called from pynput callbacks and the main thread at once
+        self._worker_lock = threading.Lock()
+
+    def _play_worker(self):
+        """Spawn paplay for each queued sound."""
+        while True:
+            pcm = self._queue.get()
+            try:
+                self._spawn_paplay(pcm)
+            finally:
+                self._queue.task_done()
 
+    def _spawn_paplay(self, pcm: bytes):
+        """Play raw PCM by piping it to paplay's stdin (no files involved)."""
         try:
-            # Write to temp file and play
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                f.write(wav_data)
-                temp_path = f.name
-
-            subprocess.Popen(
-                ["paplay", temp_path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            proc = subprocess.Popen(
+                _PAPLAY_RAW_CMD,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
-
-            # Clean up after a delay (let it play first)
-            self._temp_files.append(temp_path)
-            if len(self._temp_files) > MAX_TEMP_FILES:
-                old_file = self._temp_files.pop(0)
-                try:
-                    os.unlink(old_file)
-                except OSError as e:
-                    logger.debug("Failed to cleanup temp file %s: %s", old_file, e)
-
+            assert proc.stdin is not None
+            # Beeps are well under the pipe buffer size, so this never blocks
+            proc.stdin.write(pcm)
+            proc.stdin.close()
         except Exception as e:
             logger.error("Sound error: %s", e)
 
+    def _play_pcm(self, pcm: bytes):
+        """Queue raw PCM for playback without blocking the caller."""
+        if not self.enabled:
+            return
+
+        if self._worker is None:
+            with self._worker_lock:
+                if self._worker is None:
+                    worker = threading.Thread(target=self._play_worker, daemon=True)
+                    worker.start()
+                    self._worker = worker
+        self._queue.put(pcm)
+
     def play_start(self):
         """Play recording start sound."""
-        self._play_wav(self._start_sound)
+        self._play_pcm(self._start_pcm)
 
     def play_stop(self):
         """Play recording stop sound."""
-        self._play_wav(self._stop_sound)
+        self._play_pcm(self._stop_pcm)
 
     def play_error(self):
         """Play error sound."""
-        self._play_wav(self._error_sound)
-
-    def cleanup(self):
-        """Clean up temp files."""
-        for f in self._temp_files:
-            try:
-                os.unlink(f)
-            except OSError as e:
-                logger.debug("Failed to cleanup temp file %s: %s", f, e)
-        self._temp_files = []
+        self._play_pcm(self._error_pcm)
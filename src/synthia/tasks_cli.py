@@ -12,42 +12,63 @@ Usage:
 
 from __future__ import annotations
 
-import json
 import os
+import secrets
 import sys
+import time
 import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+# Add src to path so the script also runs standalone (python tasks_cli.py ...)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthia._jsonio import json_dumps_bytes, json_loads
+
+# Plain JSON on purpose: the dashboard and GUI kanban board read this file
+# directly, so the on-disk format is shared and must stay human-editable.
 TASKS_FILE = Path.home() / ".config" / "synthia" / "tasks.json"
 
 
+def _uuid7() -> str:
+    """Time-ordered UUID (RFC 9562 version 7): IDs sort in creation order."""
+    ms = time.time_ns() // 1_000_000
+    value = (ms & (1 << 48) - 1) << 80 | secrets.randbits(80)
+    # Set version (7) and RFC 4122 variant bits
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return str(uuid.UUID(int=value))
+
+
 def load_tasks() -> dict[str, Any]:
     if not TASKS_FILE.exists():
         return {"tasks": []}
-    with open(TASKS_FILE) as f:
-        return dict(json.load(f))
+    raw = TASKS_FILE.read_bytes()
+    return dict(json_loads(raw))
 
 
 def save_tasks(data: dict) -> None:
     TASKS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(TASKS_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    payload = json_dumps_bytes(data)
+    # Write to a sibling file and rename so a crash never leaves a truncated store
+    tmp = TASKS_FILE.with_suffix(".json.tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, TASKS_FILE)
 
 
 def find_task(data: dict[str, Any], identifier: str) -> Optional[dict[str, Any]]:
     """Find task by ID or title (partial match)."""
-    # Try exact ID match first
-    for task in data["tasks"]:
-        if task["id"] == identifier:
-            return task  # type: ignore[no-any-return]
-    # Try title match (case-insensitive, partial)
+    # Single pass: an exact ID match wins, otherwise the first title match
+    # (case-insensitive, partial)
     identifier_lower = identifier.lower()
+    title_match = None
     for task in data["tasks"]:
-        if identifier_lower in task["title"].lower():
+        if task["id"] == identifier:
             return task  # type: ignore[no-any-return]
-    return None
+        if title_match is None and identifier_lower in task["title"].lower():
+            title_match = task
+    return title_match
 
 
 def list_tasks(status: Optional[str] = None) -> None:
@@ -88,7 +109,7 @@ def add_task(
     data = load_tasks()
 
     task = {
-        "id": str(uuid.uuid4()),
+        "id": _uuid7(),
         "title": title,
         "description": description,
         "status": "todo",
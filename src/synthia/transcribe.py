@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import math
 import os
+import re
 import sys
 import tempfile
 
-import numpy as np
-
 logger = logging.getLogger(__name__)
 
 # Add cuDNN libraries to path for GPU support
@@ -20,6 +21,23 @@ _cudnn_path = os.path.join(
 if os.path.exists(_cudnn_path):
     os.environ["LD_LIBRARY_PATH"] = _cudnn_path + ":" + os.environ.get("LD_LIBRARY_PATH", "")
 
+# Filler words as whole whitespace-delimited tokens, with optional trailing punctuation
+_FILLER_RE = re.compile(r"(?<!\S)(?:uh|um|ah|er|hmm)[.,!?]*(?!\S)", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=4)
+def _get_whisper(model_name: str, device: str, compute_type: str, cpu_threads: int):
+    """Load a faster-whisper model once per process and configuration."""
+    from faster_whisper import WhisperModel
+
+    logger.info("Loading faster-whisper model: %s...", model_name)
+    model = WhisperModel(
+        model_name, device=device, compute_type=compute_type, cpu_threads=cpu_threads
+    )
+    logger.info("Faster-whisper %s loaded (%s %s)", model_name, device.upper(), compute_type)
+    return model
+
 
 class Transcriber:
     """Transcribes audio using Google Cloud Speech-to-Text or local Whisper."""
@@ -39,9 +57,6 @@ class Transcriber:
         self.whisper_model = None
         self.client = None
 
-        # Post-process to remove filler words
-        self.filler_words = {"uh", "um", "ah", "er", "hmm", "uh,", "um,", "ah,", "er,"}
-
         if use_local:
             self._init_whisper()
         else:
@@ -53,6 +68,7 @@ class Transcriber:
 
         if credentials_path:
             os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = credentials_path
+        self._speech = speech
         self.client = speech.SpeechClient()
 
         self.config = speech.RecognitionConfig(
@@ -69,17 +85,12 @@ class Transcriber:
 
     def _init_whisper(self) -> None:
         """Initialize local Whisper model using faster-whisper."""
-        from faster_whisper import WhisperModel
-
-        model_name = self.local_model
-        logger.info("Loading faster-whisper model: %s...", model_name)
-
         # Use CPU - GPU inference produces garbage with current cuDNN version
         # TODO: Re-enable GPU after upgrading ctranslate2 + matching cuDNN
-        self.whisper_model = WhisperModel(
-            model_name, device="cpu", compute_type="int8", cpu_threads=4
-        )
-        logger.info("Faster-whisper %s loaded (CPU int8)", model_name)
+        # ctranslate2 picks AVX2/VNNI int8 kernels itself; just give it every
+        # core this process may run on instead of a fixed 4.
+        cpu_threads = len(os.sched_getaffinity(0)) or 4
+        self.whisper_model = _get_whisper(self.local_model, "cpu", "int8", cpu_threads)
 
     def transcribe(self, audio_data: bytes) -> str:
         """Transcribe audio bytes to text."""
@@ -99,9 +110,7 @@ class Transcriber:
 
     def _transcribe_google(self, audio_data: bytes) -> str:
         """Transcribe using Google Cloud STT."""
-        from google.cloud import speech
-
-        audio = speech.RecognitionAudio(content=audio_data)
+        audio = self._speech.RecognitionAudio(content=audio_data)
 
         assert self.client is not None
         response = self.client.recognize(config=self.config, audio=audio)
@@ -122,21 +131,29 @@ class Transcriber:
 
     def _transcribe_whisper(self, audio_data: bytes) -> str:
         """Transcribe using faster-whisper model."""
-        # Convert bytes to numpy array (16-bit signed int)
-        audio_np = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
+        import numpy as np
+
+        # View bytes as 16-bit signed int samples (no copy)
+        samples = np.frombuffer(audio_data, dtype=np.int16)
 
         # Skip very short audio (< 0.5 seconds) to avoid hallucinations
-        duration = len(audio_np) / self.sample_rate
+        duration = samples.size / self.sample_rate
         if duration < 0.5:
             logger.debug("Audio too short (%.2fs), skipping", duration)
             return ""
 
-        # Check audio level - skip if too quiet (likely no speech)
-        rms = np.sqrt(np.mean(audio_np**2))
+        # Check audio level on the raw samples before converting, so quiet
+        # clips never pay for the float32 copy. einsum accumulates in int64
+        # through a small buffer, without a widened copy of the whole clip.
+        sum_sq = np.einsum("i,i->", samples, samples, dtype=np.int64)
+        rms = math.sqrt(sum_sq / samples.size) / 32768.0
         if rms < 0.005:
             logger.debug("Audio too quiet (rms=%.4f), skipping", rms)
             return ""
 
+        audio_np = samples.astype(np.float32)
+        audio_np *= 1.0 / 32768.0
+
         # faster-whisper returns segments generator
         assert self.whisper_model is not None
         segments, info = self.whisper_model.transcribe(
@@ -152,7 +169,7 @@ class Transcriber:
         # Collect segments with a max token limit to prevent runaway generation
         parts = []
         for segment in segments:
-            parts.append(segment.text)
+            parts.append(segment.text.strip())
             if len(parts) > 50:  # Safety limit
                 logger.warning("Hit segment limit, stopping transcription")
                 break
@@ -170,6 +187,4 @@ class Transcriber:
 
     def _clean_transcript(self, transcript: str) -> str:
         """Remove filler words from transcript."""
-        words = transcript.split()
-        cleaned = " ".join(w for w in words if w.lower().rstrip(".,!?") not in self.filler_words)
-        return cleaned
+        return _WHITESPACE_RE.sub(" ", _FILLER_RE.sub("", transcript)).strip()
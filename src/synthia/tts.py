@@ -7,9 +7,10 @@ import fcntl
 import json
 import logging
 import os
+import re
 import subprocess
-import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +71,25 @@ def speech_lock(timeout: float = SPEECH_LOCK_TIMEOUT_S):
 MAX_CHUNK_CHARS = 200
 # Piper TTS native output sample rate
 PIPER_SAMPLE_RATE = 22050
+# ffplay reading MP3 from stdin with buffering disabled for low start latency
+FFPLAY_MP3_CMD = [
+    "ffplay",
+    "-hide_banner",
+    "-loglevel",
+    "quiet",
+    "-nodisp",
+    "-autoexit",
+    "-fflags",
+    "nobuffer",
+    "-f",
+    "mp3",
+    "-i",
+    "pipe:0",
+]
+# Minimum sentence chunk length; shorter sentences merge into the next one
+MIN_CHUNK_CHARS = 20
+# Whitespace following sentence-ending punctuation
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
 
 
 class TextToSpeech:
@@ -100,9 +120,20 @@ class TextToSpeech:
 
         if credentials_path:
             os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = credentials_path
+        self._tts = texttospeech
         self.client = texttospeech.TextToSpeechClient()
         self.voice_name = voice_name
         self.language_code = "-".join(voice_name.split("-")[:2])
+
+        # Request parameters are identical for every chunk; build them once
+        self._voice = texttospeech.VoiceSelectionParams(
+            language_code=self.language_code,
+            name=self.voice_name,
+        )
+        self._audio_config = texttospeech.AudioConfig(
+            audio_encoding=texttospeech.AudioEncoding.MP3,
+            speaking_rate=self.speed,
+        )
         logger.info("Google TTS initialized with voice: %s", voice_name)
 
     def _split_into_chunks(self, text: str, max_chars: int = MAX_CHUNK_CHARS) -> list[str]:
@@ -110,32 +141,32 @@ class TextToSpeech:
         sentences = []
         current = ""
 
-        # Split by sentence endings
-        for char in text:
-            current += char
-            if char in ".!?" and len(current) >= 20:
-                sentences.append(current.strip())
+        # Split by sentence endings, merging short sentences forward
+        for part in _SENTENCE_SPLIT_RE.split(text.strip()):
+            current = f"{current} {part}" if current else part
+            if len(current) >= MIN_CHUNK_CHARS:
+                sentences.append(current)
                 current = ""
 
-        if current.strip():
-            sentences.append(current.strip())
-
-        if sentences:
-            return sentences
+        if current:
+            sentences.append(current)
 
-        # Fallback: split by max_chars at word boundaries
-        words = text.split()
+        # Fallback: split anything longer than max_chars at word boundaries
         chunks = []
-        current = ""
-        for word in words:
-            if len(current) + len(word) + 1 > max_chars:
-                if current:
-                    chunks.append(current.strip())
-                current = word
-            else:
-                current = current + " " + word if current else word
-        if current:
-            chunks.append(current.strip())
+        for sentence in sentences:
+            if len(sentence) <= max_chars:
+                chunks.append(sentence)
+                continue
+            current = ""
+            for word in sentence.split():
+                if len(current) + len(word) + 1 > max_chars:
+                    if current:
+                        chunks.append(current)
+                    current = word
+                else:
+                    current = current + " " + word if current else word
+            if current:
+                chunks.append(current)
 
         return chunks if chunks else [text]
 
@@ -170,11 +201,7 @@ class TextToSpeech:
                 if len(text) < 150:
                     return self._speak_google_chunk(text)
 
-                chunks = self._split_into_chunks(text)
-                for chunk in chunks:
-                    if chunk.strip() and not self._speak_google_chunk(chunk):
-                        return False
-                return True
+                return self._speak_google_chunks(self._split_into_chunks(text))
 
             except Exception as e:
                 logger.error("TTS error: %s", e)
@@ -211,14 +238,18 @@ class TextToSpeech:
                 stderr=subprocess.DEVNULL,
             )
 
-            # Send text directly to piper's stdin (no shell escaping needed)
+            # aplay owns the read end now; drop ours so piper sees SIGPIPE if aplay dies
+            if piper_proc.stdout is not None:
+                piper_proc.stdout.close()
+
+            # Send text directly to piper's stdin (no shell escaping needed).
+            # Piper synthesizes line by line, so terminate the line to let it
+            # start speaking without waiting for EOF.
             if piper_proc.stdin is not None:
-                piper_proc.stdin.write(text.encode("utf-8"))
+                piper_proc.stdin.write(text.encode("utf-8") + b"\n")
                 piper_proc.stdin.close()
 
             # Wait for both processes to complete
-            if piper_proc.stdout is not None:
-                piper_proc.stdout.close()
             aplay_proc.wait()
             piper_proc.wait()
 
@@ -233,46 +264,61 @@ class TextToSpeech:
 
     def _speak_google_chunk(self, text: str) -> bool:
         """Speak a single chunk using Google Cloud TTS."""
-        from google.cloud import texttospeech
+        audio = self._synthesize(text)
+        return audio is not None and self._play_mp3_bytes(audio)
 
+    def _synthesize(self, text: str) -> bytes | None:
+        """Synthesize a chunk to MP3 bytes with Google Cloud TTS."""
         try:
-            voice = texttospeech.VoiceSelectionParams(
-                language_code=self.language_code,
-                name=self.voice_name,
-            )
-
-            audio_config = texttospeech.AudioConfig(
-                audio_encoding=texttospeech.AudioEncoding.MP3,
-                speaking_rate=self.speed,
-            )
-
-            synthesis_input = texttospeech.SynthesisInput(text=text)
+            synthesis_input = self._tts.SynthesisInput(text=text)
 
             assert self.client is not None
             response = self.client.synthesize_speech(
                 input=synthesis_input,
-                voice=voice,
-                audio_config=audio_config,
+                voice=self._voice,
+                audio_config=self._audio_config,
             )
+            return bytes(response.audio_content)
 
-            # Save to temp file and play with mpv
-            with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
-                f.write(response.audio_content)
-                temp_path = f.name
+        except Exception as e:
+            logger.error("Google TTS error: %s", e)
+            return None
 
+    def _play_mp3_bytes(self, audio: bytes) -> bool:
+        """Play MP3 bytes by streaming them into ffplay (no temp file)."""
+        try:
             subprocess.run(
-                ["mpv", "--no-video", "--really-quiet", temp_path],
+                FFPLAY_MP3_CMD,
+                input=audio,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True,
             )
-
-            os.unlink(temp_path)
             return True
 
         except Exception as e:
-            logger.error("Google TTS error: %s", e)
+            logger.error("Google TTS playback error: %s", e)
             return False
 
+    def _speak_google_chunks(self, chunks: list[str]) -> bool:
+        """Speak chunks in order, synthesizing the next one while the current plays."""
+        chunks = [c for c in chunks if c.strip()]
+        if not chunks:
+            return True
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self._synthesize, chunks[0])
+            for next_chunk in chunks[1:] + [None]:
+                audio = future.result()
+                if audio is None:
+                    return False
+                if next_chunk is not None:
+                    future = executor.submit(self._synthesize, next_chunk)
+                if not self._play_mp3_bytes(audio):
+                    return False
+        return True
+
     def stop(self) -> None:
         """Stop any currently playing audio."""
-        subprocess.run(["pkill", "-f", "mpv"], check=False)
+        subprocess.run(["pkill", "-f", "ffplay"], check=False)
         subprocess.run(["pkill", "-f", "aplay"], check=False)
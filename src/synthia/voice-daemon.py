@@ -17,21 +17,23 @@ Hotkey: Right Ctrl (hold to record, release to transcribe)
 
 import logging
 
-from pynput import keyboard
-from pynput.keyboard import Key
-
-from synthia.audio import AudioRecorder
 from synthia.config import get_google_credentials_path, load_config
 from synthia.notifications import notify
 from synthia.output import type_text
 from synthia.sounds import SoundEffects
-from synthia.transcribe import Transcriber
 
 logger = logging.getLogger(__name__)
 
 
 class VoiceDaemon:
     def __init__(self):
+        # Heavy imports (pynput's X11 backend, audio, transcription) are deferred
+        # so importing this module stays cheap
+        from pynput.keyboard import Key
+
+        from synthia.audio import AudioRecorder
+        from synthia.transcribe import Transcriber
+
         print("🎙️  Synthia Daemon for Claude Code")
         print("=" * 40)
 
@@ -81,6 +83,8 @@ class VoiceDaemon:
                     logger.debug("No speech detected")
 
     def run(self):
+        from pynput import keyboard
+
         with keyboard.Listener(on_press=self.on_press, on_release=self.on_release) as listener:
             listener.join()
 
@@ -1,5 +1,6 @@
 """Web search integration for Synthia using Tavily API."""
 
+import functools
 import logging
 from typing import Optional
 
@@ -96,6 +97,25 @@ class WebSearch:
             return "I couldn't find an answer to that."
 
 
+@functools.lru_cache(maxsize=1)
+def _searcher_for_key(api_key: str) -> WebSearch:
+    """WebSearch for one API key, so the client is built once per key.
+
+    A failed construction (e.g. no API key yet) is not cached and is retried
+    on the next call.
+    """
+    return WebSearch(api_key)
+
+
+def _default_searcher() -> WebSearch:
+    """Shared WebSearch for web_search().
+
+    Config is read on every call, so a rotated tavily_api_key gets a new
+    client while an unchanged key reuses the existing one.
+    """
+    return _searcher_for_key(load_config().get("tavily_api_key", ""))
+
+
 def web_search(query: str) -> str:
     """Convenience function for web search.
 
@@ -106,8 +126,7 @@ def web_search(query: str) -> str:
         Answer string for voice response
     """
     try:
-        searcher = WebSearch()
-        return searcher.quick_answer(query)
+        return _default_searcher().quick_answer(query)
     except ValueError as e:
         return str(e)
     except Exception as e:
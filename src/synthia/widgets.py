@@ -23,7 +23,7 @@ from synthia.config_manager import (
     HookConfig,
     PluginInfo,
 )
-from synthia.memory import MemoryEntry
+from synthia.memory import CATEGORY_SUMMARY_FIELD, MemoryEntry
 from synthia.worktrees import WorktreeInfo
 
 
@@ -59,23 +59,14 @@ class MemoryListItem(ListItem):
         super().__init__()
         self.entry = entry
         self.line_number = line_number
+        # Truncate once; compose just wraps the prepared text
+        cat = entry.category.upper()
+        field = CATEGORY_SUMMARY_FIELD.get(entry.category)
+        content = entry.data.get(field, "N/A")[:50] if field else "Unknown"
+        self._text = f"[{cat}] {content}"
 
     def compose(self) -> ComposeResult:
-        cat = self.entry.category.upper()
-        if self.entry.category == "bug":
-            content = self.entry.data.get("error", "N/A")[:50]
-        elif self.entry.category == "pattern":
-            content = self.entry.data.get("topic", "N/A")[:50]
-        elif self.entry.category == "arch":
-            content = self.entry.data.get("decision", "N/A")[:50]
-        elif self.entry.category == "gotcha":
-            content = self.entry.data.get("area", "N/A")[:50]
-        elif self.entry.category == "stack":
-            content = self.entry.data.get("tool", "N/A")[:50]
-        else:
-            content = "Unknown"
-        text = f"[{cat}] {content}"
-        yield Label(text, markup=False)
+        yield Label(self._text, markup=False)
 
 
 class MemorySectionContent(Vertical):
@@ -131,12 +122,12 @@ class HookListItem(ListItem):
     def __init__(self, hook: HookConfig) -> None:
         super().__init__()
         self.hook = hook
+        # Show event type and truncated command
+        cmd_short = hook.command[-40:] if len(hook.command) > 40 else hook.command
+        self._text = f"[{hook.event}] {cmd_short}"
 
     def compose(self) -> ComposeResult:
-        # Show event type and truncated command
-        cmd_short = self.hook.command[-40:] if len(self.hook.command) > 40 else self.hook.command
-        text = f"[{self.hook.event}] {cmd_short}"
-        yield Label(text, markup=False)
+        yield Label(self._text, markup=False)
 
 
 class CommandListItem(ListItem):
@@ -145,13 +136,13 @@ class CommandListItem(ListItem):
     def __init__(self, command: CommandConfig) -> None:
         super().__init__()
         self.command = command
+        # Show filename (without .md) and description preview
+        name = command.filename.replace(".md", "")
+        desc = command.description[:40] if command.description else "No description"
+        self._text = f"/{name} - {desc}"
 
     def compose(self) -> ComposeResult:
-        # Show filename (without .md) and description preview
-        name = self.command.filename.replace(".md", "")
-        desc = self.command.description[:40] if self.command.description else "No description"
-        text = f"/{name} - {desc}"
-        yield Label(text)
+        yield Label(self._text)
 
 
 class SettingListItem(ListItem):
@@ -183,10 +174,15 @@ class WorktreeListItem(ListItem):
         super().__init__()
         self.worktree = worktree
         self.expanded = expanded
+        # Worktree data is fixed for the item's lifetime, so format both
+        # layouts once instead of on every compose
+        self._collapsed_text, self._expanded_text = self._format_texts(worktree)
 
-    def compose(self) -> ComposeResult:
+    @staticmethod
+    def _format_texts(worktree: WorktreeInfo) -> tuple[str, str]:
+        """Return the (collapsed, expanded) display text for a worktree."""
         # Get progress
-        completed, total = self.worktree.progress
+        completed, total = worktree.progress
         if total > 0:
             # Create progress bar: ████░░░░ 4/5
             filled = int((completed / total) * 8)
@@ -196,23 +192,22 @@ class WorktreeListItem(ListItem):
             progress_str = "No tasks"
 
         # Get issue display
-        issue_str = f"#{self.worktree.issue_number}" if self.worktree.issue_number else ""
+        issue_str = f"#{worktree.issue_number}" if worktree.issue_number else ""
 
         # Get short path (just the worktree folder name)
-        short_path = Path(self.worktree.path).name
-
-        if self.expanded:
-            # Full details
-            lines = [f"📁 {short_path}"]
-            lines.append(f"   Branch: {self.worktree.branch}")
-            if self.worktree.issue_number:
-                lines.append(f"   Issue: #{self.worktree.issue_number}")
-            if self.worktree.session_summary:
-                lines.append(f'   Session: "{self.worktree.session_summary[:40]}..."')
-            lines.append(f"   Tasks: {progress_str}")
-            text = "\n".join(lines)
-        else:
-            # Collapsed: 📁 issue-295  ████░░░░ 4/5  #295
-            text = f"📁 {short_path}  {progress_str}  {issue_str}"
+        short_path = Path(worktree.path).name
 
-        yield Label(text, markup=False)
+        # Full details
+        lines = [f"📁 {short_path}"]
+        lines.append(f"   Branch: {worktree.branch}")
+        if worktree.issue_number:
+            lines.append(f"   Issue: #{worktree.issue_number}")
+        if worktree.session_summary:
+            lines.append(f'   Session: "{worktree.session_summary[:40]}..."')
+        lines.append(f"   Tasks: {progress_str}")
+
+        # Collapsed: 📁 issue-295  ████░░░░ 4/5  #295
+        return f"📁 {short_path}  {progress_str}  {issue_str}", "\n".join(lines)
+
+    def compose(self) -> ComposeResult:
+        yield Label(self._expanded_text if self.expanded else self._collapsed_text, markup=False)
@@ -6,20 +6,25 @@ Supports scanning multiple configured repositories.
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 import re
 import subprocess
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 import yaml
 
+from synthia._jsonio import json_loads
+
 # Config file location
 CONFIG_PATH = Path.home() / ".config" / "synthia" / "worktrees.yaml"
 
 
-@dataclass
+@dataclass(slots=True)
 class WorktreeTask:
     """Represents a task from a Claude Code session."""
 
@@ -28,7 +33,7 @@ class WorktreeTask:
     active_form: str
 
 
-@dataclass
+@dataclass(slots=True)
 class WorktreeInfo:
     """Information about a git worktree and its associated Claude Code session."""
 
@@ -38,7 +43,9 @@ class WorktreeInfo:
     issue_title: Optional[str] = None
     session_id: Optional[str] = None
     session_summary: Optional[str] = None
-    tasks: list[WorktreeTask] = field(default_factory=list)
+    # Most worktrees have no session, so the default is a shared empty tuple
+    # rather than a fresh list per instance; the scanner assigns a list.
+    tasks: Sequence[WorktreeTask] = ()
 
     @property
     def progress(self) -> tuple[int, int]:
@@ -47,6 +54,14 @@ class WorktreeInfo:
         return (completed, len(self.tasks))
 
 
+# Lookup indexes over a scan result: ({resolved path: wt}, {issue number: wt})
+_WorktreeIndex = tuple[dict[str, WorktreeInfo], dict[int, WorktreeInfo]]
+
+# Last scan result, keyed by the filesystem signature it was computed from,
+# plus lazily built lookup indexes over it: (signature, worktrees, indexes)
+_scan_cache: Optional[tuple[tuple, list[WorktreeInfo], Optional[_WorktreeIndex]]] = None
+
+
 # Patterns for extracting issue numbers from branch names
 ISSUE_PATTERNS = [
     r"feature/(\d+)-",  # feature/295-flosale-mobile
@@ -57,6 +72,12 @@ ISSUE_PATTERNS = [
     r"(\d+)-",  # 295-flosale-mobile (fallback)
 ]
 
+# All patterns in one regex. Each alternative is anchored with a lazy ".*?"
+# so an earlier pattern matching anywhere still wins over a later one,
+# exactly like trying them in order, but with a single search.
+_ISSUE_RE = re.compile("^(?:" + "|".join(f".*?{p}" for p in ISSUE_PATTERNS) + ")")
+_ASCII_DIGITS = frozenset("0123456789")
+
 
 def extract_issue_number(branch: str) -> Optional[int]:
     """Extract issue number from branch name.
@@ -75,10 +96,17 @@ def extract_issue_number(branch: str) -> Optional[int]:
     Returns:
         The issue number if found, None otherwise
     """
-    for pattern in ISSUE_PATTERNS:
-        match = re.search(pattern, branch)
-        if match:
-            return int(match.group(1))
+    # Every pattern needs "<digits>-"; plain names like main/develop exit here
+    if "-" not in branch:
+        return None
+    # Names like release-candidate have no digits at all. \d also matches
+    # non-ASCII digits, so the set check only applies to ASCII names.
+    if branch.isascii() and _ASCII_DIGITS.isdisjoint(branch):
+        return None
+
+    match = _ISSUE_RE.match(branch)
+    if match and match.lastindex:
+        return int(match.group(match.lastindex))
     return None
 
 
@@ -103,7 +131,7 @@ def _parse_worktree_list(output: str) -> list[dict[str, str]]:
     worktrees = []
     current: dict[str, str] = {}
 
-    for line in output.strip().split("\n"):
+    for line in output.splitlines():
         line = line.strip()
         if not line:
             if current.get("path") and current.get("branch"):
@@ -112,13 +140,9 @@ def _parse_worktree_list(output: str) -> list[dict[str, str]]:
             continue
 
         if line.startswith("worktree "):
-            current["path"] = line[9:]  # Remove "worktree " prefix
+            current["path"] = line.removeprefix("worktree ")
         elif line.startswith("branch "):
-            # Remove "branch refs/heads/" prefix
-            branch = line[7:]  # Remove "branch " prefix
-            if branch.startswith("refs/heads/"):
-                branch = branch[11:]  # Remove "refs/heads/" prefix
-            current["branch"] = branch
+            current["branch"] = line.removeprefix("branch ").removeprefix("refs/heads/")
         # HEAD lines are ignored for now
 
     # Don't forget the last entry
@@ -128,104 +152,157 @@ def _parse_worktree_list(output: str) -> list[dict[str, str]]:
     return worktrees
 
 
-def _find_session_for_path(project_path: str) -> Optional[dict]:
-    """Find Claude Code session matching a project path.
+@functools.lru_cache(maxsize=4096)
+def _resolve_absolute(path: str) -> str:
+    """Memoized resolve() for absolute paths, which don't depend on the cwd."""
+    return str(Path(path).resolve())
 
-    Searches through ~/.claude/projects/*/sessions-index.json files.
 
-    Args:
-        project_path: Absolute path to the project/worktree
+def _resolve(path: str) -> str:
+    """Resolve a path to its canonical string form.
 
-    Returns:
-        Session entry dict if found, None otherwise
+    The same worktree and project paths are resolved on every scan; each
+    resolve() costs stat/readlink syscalls per path component, so absolute
+    paths are memoized. Relative or empty paths resolve against the current
+    directory and are never cached.
     """
-    claude_dir = Path.home() / ".claude" / "projects"
+    if not os.path.isabs(path):
+        return str(Path(path).resolve())
+    return _resolve_absolute(path)
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, with orjson when available (see synthia._jsonio).
+
+    Raises json.JSONDecodeError (orjson's error subclasses it) or OSError.
+    """
+    raw = path.read_bytes()
+    return json_loads(raw)
 
-    if not claude_dir.exists():
-        return None
 
-    # Normalize the project path for comparison
-    normalized_path = str(Path(project_path).resolve())
+def _build_session_index() -> dict[str, dict]:
+    """Map project paths to their Claude Code session entries.
 
+    Reads every ~/.claude/projects/*/sessions-index.json once, so a scan
+    costs one pass over the session files regardless of worktree count.
+    When several entries share a path, the first one found wins.
+
+    Returns:
+        Dict of resolved project path -> session entry dict
+    """
+    claude_dir = Path.home() / ".claude" / "projects"
+    index: dict[str, dict] = {}
+
+    # scandir entries carry their type from the directory listing, and a
+    # missing index file surfaces as an error on open, so each project costs
+    # a single open() rather than is_dir() + exists() + open() stats.
     try:
-        for project_dir in claude_dir.iterdir():
-            if not project_dir.is_dir():
-                continue
-
-            index_file = project_dir / "sessions-index.json"
-            if not index_file.exists():
-                continue
-
-            try:
-                with open(index_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                entries = data.get("entries", [])
-                for entry in entries:
-                    entry_path = entry.get("projectPath", "")
-                    # Normalize for comparison
-                    if str(Path(entry_path).resolve()) == normalized_path:
-                        return dict(entry)
-            except (json.JSONDecodeError, IOError):
-                continue
+        with os.scandir(claude_dir) as it:
+            for project_dir in it:
+                if not project_dir.is_dir():
+                    continue
 
-    except OSError:
-        return None
+                try:
+                    data = _read_json(Path(project_dir.path) / "sessions-index.json")
+
+                    entries = data.get("entries", [])
+                    for entry in entries:
+                        # Normalize for comparison
+                        key = _resolve(entry.get("projectPath", ""))
+                        # Entries come from a fresh parse, so they can be kept
+                        # as-is instead of copied; later duplicates are skipped.
+                        if key not in index:
+                            index[key] = entry
+                except (json.JSONDecodeError, IOError):
+                    # Also covers projects without a sessions-index.json
+                    continue
 
-    return None
+    except OSError:
+        return index
 
+    return index
 
-def _load_tasks_for_session(session_id: str) -> list[WorktreeTask]:
-    """Load tasks from Claude Code todo files for a session.
 
-    Tasks are stored in ~/.claude/todos/{sessionId}-agent-*.json
+def _read_todo_file(todo_file: Path) -> list[WorktreeTask]:
+    """Parse one Claude Code todo file into tasks.
 
     Args:
-        session_id: The Claude Code session ID
+        todo_file: Path to a {sessionId}-agent-*.json file
 
     Returns:
-        List of WorktreeTask objects
+        List of WorktreeTask objects, empty if the file is unreadable
     """
-    todos_dir = Path.home() / ".claude" / "todos"
+    try:
+        data = _read_json(todo_file)
+    except (json.JSONDecodeError, IOError):
+        return []
 
-    if not todos_dir.exists():
+    # Handle both list format and object format
+    if isinstance(data, list):
+        task_list = data
+    elif isinstance(data, dict):
+        task_list = data.get("tasks", [])
+    else:
         return []
 
     tasks = []
-    pattern = f"{session_id}-agent-*.json"
+    for task_data in task_list:
+        if isinstance(task_data, dict):
+            task = WorktreeTask(
+                content=str(task_data.get("content", task_data.get("subject", ""))),
+                status=str(task_data.get("status", "pending")),
+                active_form=str(task_data.get("activeForm", task_data.get("active_form", ""))),
+            )
+            tasks.append(task)
+    return tasks
 
-    try:
-        for todo_file in todos_dir.glob(pattern):
-            try:
-                with open(todo_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # Handle both list format and object format
-                if isinstance(data, list):
-                    task_list = data
-                elif isinstance(data, dict):
-                    task_list = data.get("tasks", [])
-                else:
-                    continue
 
-                for task_data in task_list:
-                    if isinstance(task_data, dict):
-                        task = WorktreeTask(
-                            content=str(task_data.get("content", task_data.get("subject", ""))),
-                            status=str(task_data.get("status", "pending")),
-                            active_form=str(
-                                task_data.get("activeForm", task_data.get("active_form", ""))
-                            ),
-                        )
-                        tasks.append(task)
+def _index_todos() -> dict[str, list[Path]]:
+    """Group Claude Code todo files by session ID in one directory scan.
 
-            except (json.JSONDecodeError, IOError):
-                continue
+    Files are named {sessionId}-agent-*.json in ~/.claude/todos.
 
+    Returns:
+        Dict of session ID -> list of that session's todo file paths
+    """
+    todos_dir = Path.home() / ".claude" / "todos"
+    index: dict[str, list[Path]] = {}
+
+    try:
+        with os.scandir(todos_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.endswith(".json") and "-agent-" in name:
+                    session_id = name.split("-agent-", 1)[0]
+                    index.setdefault(session_id, []).append(Path(entry.path))
     except OSError:
-        return []
+        return {}
+
+    return index
 
-    return tasks
+
+def _load_tasks_for_session(
+    session_id: str, todo_index: Optional[dict[str, list[Path]]] = None
+) -> list[WorktreeTask]:
+    """Load tasks from Claude Code todo files for a session.
+
+    Tasks are stored in ~/.claude/todos/{sessionId}-agent-*.json
+
+    Args:
+        session_id: The Claude Code session ID
+        todo_index: Session ID -> todo files map from _index_todos; scanned
+            on demand when not given
+
+    Returns:
+        List of WorktreeTask objects
+    """
+    if todo_index is None:
+        todo_index = _index_todos()
+
+    todo_files = todo_index.get(session_id, [])
+
+    # Read sequentially: callers already enrich worktrees in parallel
+    return [task for f in todo_files for task in _read_todo_file(f)]
 
 
 def load_config() -> dict[str, Any]:
@@ -326,22 +403,64 @@ def remove_repo(repo_path: str) -> bool:
     return True  # Didn't exist anyway
 
 
-def _scan_repo_worktrees(repo_path: str) -> list[WorktreeInfo]:
+def _enrich_worktree(
+    wt: dict[str, str],
+    session_index: dict[str, dict],
+    todo_index: dict[str, list[Path]],
+) -> WorktreeInfo:
+    """Build WorktreeInfo for a parsed worktree, with its session and tasks.
+
+    Args:
+        wt: Dict with 'path' and 'branch' keys from _parse_worktree_list
+        session_index: Project path -> session map from _build_session_index
+        todo_index: Session ID -> todo files map from _index_todos
+
+    Returns:
+        WorktreeInfo with session and task data filled in when found
+    """
+    path = wt["path"]
+    branch = wt["branch"]
+
+    info = WorktreeInfo(
+        path=path,
+        branch=branch,
+        issue_number=extract_issue_number(branch),
+    )
+
+    session = session_index.get(_resolve(path))
+    if session:
+        info.session_id = session.get("sessionId")
+        info.session_summary = session.get("summary")
+
+        if info.session_id:
+            tasks = _load_tasks_for_session(info.session_id, todo_index)
+            if tasks:
+                info.tasks = tasks
+
+    return info
+
+
+def _scan_repo_worktrees(
+    repo_path: str,
+    session_index: dict[str, dict],
+    todo_index: dict[str, list[Path]],
+) -> list[WorktreeInfo]:
     """Scan worktrees for a specific repository.
 
     Args:
         repo_path: Path to the git repository
+        session_index: Project path -> session map from _build_session_index
+        todo_index: Session ID -> todo files map from _index_todos
 
     Returns:
         List of WorktreeInfo objects for that repo
     """
-    worktrees: list[WorktreeInfo] = []
-
     try:
+        # stderr is never read, so don't pipe it; decode stdout once ourselves
         result = subprocess.run(
             ["git", "worktree", "list", "--porcelain"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             timeout=10,
             cwd=repo_path,
         )
@@ -349,32 +468,134 @@ def _scan_repo_worktrees(repo_path: str) -> list[WorktreeInfo]:
         if result.returncode != 0:
             return []
 
-        parsed = _parse_worktree_list(result.stdout)
+        parsed = _parse_worktree_list(result.stdout.decode("utf-8", "replace"))
 
     except (subprocess.SubprocessError, FileNotFoundError, OSError):
         return []
 
-    for wt in parsed:
-        path = wt["path"]
-        branch = wt["branch"]
+    if not parsed:
+        return []
+
+    # A pool only pays for itself with several worktrees to enrich
+    if len(parsed) <= 2:
+        return [_enrich_worktree(wt, session_index, todo_index) for wt in parsed]
 
-        info = WorktreeInfo(
-            path=path,
-            branch=branch,
-            issue_number=extract_issue_number(branch),
+    # Session and todo lookups are independent file I/O per worktree
+    with ThreadPoolExecutor(max_workers=min(8, len(parsed))) as executor:
+        return list(
+            executor.map(lambda wt: _enrich_worktree(wt, session_index, todo_index), parsed)
         )
 
-        session = _find_session_for_path(path)
-        if session:
-            info.session_id = session.get("sessionId")
-            info.session_summary = session.get("summary")
 
-            if info.session_id:
-                info.tasks = _load_tasks_for_session(info.session_id)
+def _mtime_ns(path: Path) -> int:
+    """Return a path's mtime in ns, or 0 if it cannot be stat'ed."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
 
-        worktrees.append(info)
 
-    return worktrees
+def _dir_mtimes(directory: Path) -> list[tuple[str, int]]:
+    """Return (name, mtime_ns) for every entry in a directory."""
+    try:
+        with os.scandir(directory) as it:
+            return sorted((e.name, e.stat().st_mtime_ns) for e in it)
+    except OSError:
+        return []
+
+
+# Absolute repo path -> resolved git common dir. Only successful lookups are
+# kept, so a directory that later becomes a repository is picked up.
+_common_dirs: dict[str, Path] = {}
+
+
+def _git_common_dir(repo: str) -> Optional[Path]:
+    """Return the shared .git directory for a repo, worktree or subdirectory.
+
+    Linked worktrees have a .git *file*, and subdirectories have no .git at
+    all, so the metadata to watch has to come from git itself. The answer
+    never changes for a path, so git is only asked once per repo.
+    """
+    key = os.path.abspath(repo)
+    common = _common_dirs.get(key)
+    if common is None:
+        try:
+            result = subprocess.run(
+                ["git", "rev-parse", "--git-common-dir"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=10,
+                cwd=key,
+            )
+        except (subprocess.SubprocessError, OSError):
+            return None
+        if result.returncode != 0:
+            return None
+        # Relative output is relative to the directory git ran in
+        common = Path(key, result.stdout.decode().strip()).resolve()
+        _common_dirs[key] = common
+    return common
+
+
+def _git_signature(common: Path) -> tuple:
+    """Stat the git metadata that `git worktree list` output depends on."""
+    worktrees = common / "worktrees"
+    try:
+        names = sorted(os.listdir(worktrees))
+    except OSError:
+        names = []
+    return (
+        _mtime_ns(common / "HEAD"),
+        _mtime_ns(common / "packed-refs"),
+        _mtime_ns(common / "refs" / "heads"),
+        _mtime_ns(worktrees),
+        tuple((name, _mtime_ns(worktrees / name / "HEAD")) for name in names),
+    )
+
+
+def _scan_signature(repos: list[str]) -> tuple:
+    """Fingerprint everything a scan reads, using stat calls only.
+
+    Covers the git metadata of each repo (worktree add/remove and HEAD
+    changes in any worktree), every sessions-index.json, and the todo files.
+    If the fingerprint is unchanged, the previous scan result is still valid.
+    """
+    claude_dir = Path.home() / ".claude"
+    projects_dir = claude_dir / "projects"
+
+    parts: list[Any] = [tuple(repos), os.getcwd()]
+    for repo in repos or ["."]:
+        common = _git_common_dir(repo)
+        parts.append(_git_signature(common) if common is not None else None)
+    parts.append(_mtime_ns(projects_dir))
+    parts.append(
+        tuple((str(p), _mtime_ns(p)) for p in sorted(projects_dir.glob("*/sessions-index.json")))
+    )
+    parts.append(tuple(_dir_mtimes(claude_dir / "todos")))
+    return tuple(parts)
+
+
+def _scan_all(configured_repos: list[str]) -> list[WorktreeInfo]:
+    """Scan configured repos, or the current directory if none are configured."""
+    session_index = _build_session_index()
+    todo_index = _index_todos()
+
+    # If repos configured, scan all of them
+    if configured_repos:
+        all_worktrees: list[WorktreeInfo] = []
+        seen_paths: set[str] = set()
+
+        for repo in configured_repos:
+            for wt in _scan_repo_worktrees(repo, session_index, todo_index):
+                # Avoid duplicates
+                if wt.path not in seen_paths:
+                    all_worktrees.append(wt)
+                    seen_paths.add(wt.path)
+
+        return all_worktrees
+
+    # Fallback: scan current directory
+    return _scan_repo_worktrees(".", session_index, todo_index)
 
 
 def scan_worktrees() -> list[WorktreeInfo]:
@@ -392,27 +613,40 @@ def scan_worktrees() -> list[WorktreeInfo]:
        - Finds matching Claude Code session in sessions-index.json
        - Loads tasks from todo files
 
+    Results are cached and reused until the git metadata, session indexes or
+    todo files change (see _scan_signature).
+
     Returns:
         List of WorktreeInfo objects with session and task data
     """
+    global _scan_cache
+
     configured_repos = get_configured_repos()
+    signature = _scan_signature(configured_repos)
 
-    # If repos configured, scan all of them
-    if configured_repos:
-        all_worktrees: list[WorktreeInfo] = []
-        seen_paths: set[str] = set()
+    if _scan_cache is None or _scan_cache[0] != signature:
+        _scan_cache = (signature, _scan_all(configured_repos), None)
 
-        for repo in configured_repos:
-            for wt in _scan_repo_worktrees(repo):
-                # Avoid duplicates
-                if wt.path not in seen_paths:
-                    all_worktrees.append(wt)
-                    seen_paths.add(wt.path)
+    return list(_scan_cache[1])
 
-        return all_worktrees
 
-    # Fallback: scan current directory
-    return _scan_repo_worktrees(".")
+def _worktree_index() -> _WorktreeIndex:
+    """Return path and issue indexes for the current (cached) scan."""
+    global _scan_cache
+
+    worktrees = scan_worktrees()
+    assert _scan_cache is not None
+    signature, cached, index = _scan_cache
+    if index is None:
+        by_path: dict[str, WorktreeInfo] = {}
+        by_issue: dict[int, WorktreeInfo] = {}
+        for wt in worktrees:
+            by_path.setdefault(_resolve(wt.path), wt)
+            if wt.issue_number is not None:
+                by_issue.setdefault(wt.issue_number, wt)
+        index = (by_path, by_issue)
+        _scan_cache = (signature, cached, index)
+    return index
 
 
 def get_worktree_by_path(path: str) -> Optional[WorktreeInfo]:
@@ -424,11 +658,8 @@ def get_worktree_by_path(path: str) -> Optional[WorktreeInfo]:
     Returns:
         WorktreeInfo if found, None otherwise
     """
-    normalized = str(Path(path).resolve())
-    for wt in scan_worktrees():
-        if str(Path(wt.path).resolve()) == normalized:
-            return wt
-    return None
+    by_path, _ = _worktree_index()
+    return by_path.get(_resolve(path))
 
 
 def get_worktree_by_issue(issue_number: int) -> Optional[WorktreeInfo]:
@@ -440,7 +671,5 @@ def get_worktree_by_issue(issue_number: int) -> Optional[WorktreeInfo]:
     Returns:
         WorktreeInfo if found, None otherwise
     """
-    for wt in scan_worktrees():
-        if wt.issue_number == issue_number:
-            return wt
-    return None
+    _, by_issue = _worktree_index()
+    return by_issue.get(issue_number)
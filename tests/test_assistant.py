@@ -1,12 +1,94 @@
 """Tests for synthia.assistant module."""
 
 import json
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from synthia.assistant import SYSTEM_PROMPT, Assistant
 
+_VOLUME_PAYLOAD = json.dumps(
+    {
+        "speech": "Turning up the volume.",
+        "actions": [{"type": "change_volume", "delta": 10}],
+    }
+)
+_MULTI_ACTION_PAYLOAD = json.dumps(
+    {
+        "speech": "Opening Firefox and maximizing.",
+        "actions": [
+            {"type": "open_app", "app": "firefox"},
+            {"type": "maximize_window"},
+        ],
+    }
+)
+
+# Canned replies for tests that stub out the model call
+_OK_RESPONSE = {"speech": "Hi!", "actions": []}
+_CLAUDE_OK = {"speech": "Hi from Claude!", "actions": []}
+_DONE = {"speech": "Done.", "actions": []}
+
+# History entries for the trimming test, built once at import
+_TRIM_MSGS = tuple(f"msg-{i}" for i in range(6))
+
+_PROMPT_DATE = "Monday, January 01, 2025 at 10:00 AM"
+
+# (response text, expected speech, expected actions) for _parse_response
+PARSE_CASES = [
+    pytest.param('{"speech": "Hello there.", "actions": []}', "Hello there.", [], id="valid-json"),
+    pytest.param(
+        _VOLUME_PAYLOAD,
+        "Turning up the volume.",
+        [{"type": "change_volume", "delta": 10}],
+        id="with-actions",
+    ),
+    pytest.param(
+        '```json\n{"speech": "Done.", "actions": []}\n```', "Done.", [], id="markdown-block"
+    ),
+    pytest.param(
+        '```\n{"speech": "Done.", "actions": []}\n```', "Done.", [], id="markdown-no-language"
+    ),
+    pytest.param(
+        '{"actions": [{"type": "mute"}]}',
+        "I processed your request.",
+        [{"type": "mute"}],
+        id="missing-speech-defaults",
+    ),
+    pytest.param('{"speech": "Hello!"}', "Hello!", [], id="missing-actions-defaults"),
+    pytest.param('{"speech": "Hi.",  "actions": [],}', "Hi.", [], id="trailing-comma-fixed"),
+    pytest.param(
+        'Here is my response: {"speech": "Got it.", "actions": []} Hope that helps!',
+        "Got it.",
+        [],
+        id="embedded-in-text",
+    ),
+]
+
+
+def _raise_connection_refused(_text: str) -> dict:
+    """Stand-in for a model call whose backend is unreachable."""
+    raise Exception("Connection refused")
+
+
+def _bare_assistant(use_local: bool = True, dev_mode: bool = False) -> Assistant:
+    """Build an Assistant with only the attributes process() reads.
+
+    Skips __init__, so Claude mode never tries to import anthropic.
+    """
+    assistant = Assistant.__new__(Assistant)
+    assistant.use_local = use_local
+    assistant.dev_mode = dev_mode
+    assistant.memory_size = 10
+    assistant.conversation_history = []
+    return assistant
+
+
+@pytest.fixture(scope="class")
+def assistant():
+    """One local assistant shared by every test in a class."""
+    return Assistant(use_local=True, memory_size=10)
+
 
 class TestAssistantInit:
     """Test Assistant __init__ stores config correctly."""
@@ -28,20 +110,16 @@ class TestAssistantInit:
 
     def test_init_claude_mode(self, mocker):
         """Claude mode creates an Anthropic client."""
-        mock_anthropic_cls = MagicMock()
-        mock_client = MagicMock()
-        mock_anthropic_cls.return_value = mock_client
-        mocker.patch.dict("sys.modules", {"anthropic": mock_anthropic_cls})
-        mock_anthropic_cls.Anthropic = MagicMock(return_value=mock_client)
-
-        # Re-import to pick up the mock -- but the import happens inside __init__
-        # so we need to patch it at that level
-        mocker.patch("anthropic.Anthropic", mock_anthropic_cls.Anthropic, create=True)
+        # anthropic is imported inside __init__ and is an optional dependency,
+        # so a stand-in module is the one patch needed
+        mock_anthropic = MagicMock()
+        mocker.patch.dict("sys.modules", {"anthropic": mock_anthropic})
 
         assistant = Assistant(api_key="test-key", use_local=False)
         assert assistant.use_local is False
         assert assistant.model == "claude-haiku-4-20250514"
-        assert assistant.client is not None
+        mock_anthropic.Anthropic.assert_called_once_with(api_key="test-key")
+        assert assistant.client is mock_anthropic.Anthropic.return_value
 
     def test_init_custom_memory_size(self):
         """Memory size is configurable."""
@@ -67,28 +145,33 @@ class TestAssistantInit:
 class TestAddToHistory:
     """Test conversation history management."""
 
-    def test_add_to_history_basic(self):
+    @pytest.fixture(autouse=True)
+    def _reset(self, assistant):
+        """Start each test with empty history and the default memory size."""
+        assistant.conversation_history.clear()
+        assistant.memory_size = 10
+
+    def test_add_to_history_basic(self, assistant):
         """Messages are appended to history."""
-        assistant = Assistant(use_local=True, memory_size=10)
         assistant._add_to_history("user", "Hello")
         assert len(assistant.conversation_history) == 1
         assert assistant.conversation_history[0] == {"role": "user", "content": "Hello"}
 
-    def test_add_to_history_multiple(self):
+    def test_add_to_history_multiple(self, assistant):
         """Multiple messages are stored in order."""
-        assistant = Assistant(use_local=True, memory_size=10)
         assistant._add_to_history("user", "Hello")
         assistant._add_to_history("assistant", '{"speech": "Hi!", "actions": []}')
         assert len(assistant.conversation_history) == 2
         assert assistant.conversation_history[0]["role"] == "user"
         assert assistant.conversation_history[1]["role"] == "assistant"
 
-    def test_history_trimming(self):
+    def test_history_trimming(self, assistant):
         """History is trimmed when it exceeds memory_size * 2."""
-        assistant = Assistant(use_local=True, memory_size=2)
         # memory_size=2 means max 4 messages (2 pairs)
-        for i in range(6):
-            assistant._add_to_history("user", f"msg-{i}")
+        assistant.memory_size = 2
+        add = assistant._add_to_history
+        for content in _TRIM_MSGS:
+            add("user", content)
         # After 6 additions with limit of 4, should have trimmed down to 4
         assert len(assistant.conversation_history) == 4
         # Oldest messages should have been removed
@@ -99,153 +182,76 @@ class TestAddToHistory:
 class TestParseResponse:
     """Test _parse_response JSON parsing logic."""
 
-    def setup_method(self):
-        """Create a local assistant for parse testing."""
-        self.assistant = Assistant(use_local=True, memory_size=10)
-
-    def test_parse_valid_json(self):
-        """Valid JSON with speech and actions is parsed correctly."""
-        response = '{"speech": "Hello there.", "actions": []}'
-        result = self.assistant._parse_response(response)
-        assert result["speech"] == "Hello there."
-        assert result["actions"] == []
-
-    def test_parse_json_with_actions(self):
-        """JSON with actions is parsed correctly."""
-        response = json.dumps(
-            {
-                "speech": "Turning up the volume.",
-                "actions": [{"type": "change_volume", "delta": 10}],
-            }
-        )
-        result = self.assistant._parse_response(response)
-        assert result["speech"] == "Turning up the volume."
-        assert len(result["actions"]) == 1
-        assert result["actions"][0]["type"] == "change_volume"
-        assert result["actions"][0]["delta"] == 10
-
-    def test_parse_markdown_code_block(self):
-        """JSON wrapped in markdown code blocks is extracted."""
-        response = '```json\n{"speech": "Done.", "actions": []}\n```'
-        result = self.assistant._parse_response(response)
-        assert result["speech"] == "Done."
-        assert result["actions"] == []
-
-    def test_parse_markdown_code_block_no_language(self):
-        """JSON wrapped in plain markdown code blocks is extracted."""
-        response = '```\n{"speech": "Done.", "actions": []}\n```'
-        result = self.assistant._parse_response(response)
-        assert result["speech"] == "Done."
-        assert result["actions"] == []
+    @pytest.fixture(autouse=True)
+    def _fresh_history(self, assistant):
+        """Start each test with an empty conversation history."""
+        assistant.clear_history()
 
-    def test_parse_missing_speech_key(self):
-        """Missing speech key gets a default value."""
-        response = '{"actions": [{"type": "mute"}]}'
-        result = self.assistant._parse_response(response)
-        assert result["speech"] == "I processed your request."
-        assert len(result["actions"]) == 1
-
-    def test_parse_missing_actions_key(self):
-        """Missing actions key gets a default empty list."""
-        response = '{"speech": "Hello!"}'
-        result = self.assistant._parse_response(response)
-        assert result["speech"] == "Hello!"
-        assert result["actions"] == []
+    @pytest.mark.parametrize("response,speech,actions", PARSE_CASES)
+    def test_parse(self, assistant, response, speech, actions):
+        """Well-formed, wrapped or incomplete JSON yields speech and actions."""
+        result = assistant._parse_response(response)
+        assert result["speech"] == speech
+        assert result["actions"] == actions
 
-    def test_parse_invalid_json_fallback(self):
+    def test_parse_invalid_json_fallback(self, assistant):
         """Invalid JSON falls back to treating the text as speech."""
         response = "I don't know how to respond in JSON."
-        result = self.assistant._parse_response(response)
+        result = assistant._parse_response(response)
         assert "I don't know how to respond in JSON." in result["speech"]
         assert result["actions"] == []
 
-    def test_parse_trailing_comma_fix(self):
-        """Trailing commas before } are fixed."""
-        response = '{"speech": "Hi.",  "actions": [],}'
-        result = self.assistant._parse_response(response)
-        assert result["speech"] == "Hi."
-
-    def test_parse_json_embedded_in_text(self):
-        """JSON embedded within surrounding text is extracted via bracket matching."""
-        response = 'Here is my response: {"speech": "Got it.", "actions": []} Hope that helps!'
-        result = self.assistant._parse_response(response)
-        assert result["speech"] == "Got it."
-        assert result["actions"] == []
-
-    def test_parse_adds_to_history(self):
+    def test_parse_adds_to_history(self, assistant):
         """Parsed response is added to conversation history."""
         response = '{"speech": "Hello!", "actions": []}'
-        self.assistant._parse_response(response)
-        assert len(self.assistant.conversation_history) == 1
-        assert self.assistant.conversation_history[0]["role"] == "assistant"
+        assistant._parse_response(response)
+        assert len(assistant.conversation_history) == 1
+        assert assistant.conversation_history[0]["role"] == "assistant"
 
-    def test_parse_complex_actions(self):
+    def test_parse_complex_actions(self, assistant):
         """Multiple actions are parsed correctly."""
-        response = json.dumps(
-            {
-                "speech": "Opening Firefox and maximizing.",
-                "actions": [
-                    {"type": "open_app", "app": "firefox"},
-                    {"type": "maximize_window"},
-                ],
-            }
-        )
-        result = self.assistant._parse_response(response)
-        assert len(result["actions"]) == 2
-        assert result["actions"][0]["type"] == "open_app"
-        assert result["actions"][1]["type"] == "maximize_window"
+        result = assistant._parse_response(_MULTI_ACTION_PAYLOAD)
+        assert result["actions"] == [
+            {"type": "open_app", "app": "firefox"},
+            {"type": "maximize_window"},
+        ]
 
 
 class TestProcess:
     """Test the main process() method."""
 
-    def test_process_empty_input(self):
-        """Empty input returns a default message without calling any API."""
-        assistant = Assistant(use_local=True)
-        result = assistant.process("")
-        assert result["speech"] == "I didn't catch that. Could you repeat?"
-        assert result["actions"] == []
-
-    def test_process_whitespace_only_input(self):
-        """Whitespace-only input returns the default message."""
-        assistant = Assistant(use_local=True)
-        result = assistant.process("   \n\t  ")
+    @pytest.mark.parametrize("text", ["", "   \n\t  "], ids=["empty", "whitespace"])
+    def test_process_empty_or_whitespace(self, assistant, text):
+        """Blank input returns a default message without calling any API."""
+        result = assistant.process(text)
         assert result["speech"] == "I didn't catch that. Could you repeat?"
         assert result["actions"] == []
 
-    def test_process_local_calls_ollama(self, mocker):
+    def test_process_local_calls_ollama(self):
         """Process with use_local=True calls _process_ollama."""
         assistant = Assistant(use_local=True)
-        mock_ollama = mocker.patch.object(
-            assistant,
-            "_process_ollama",
-            return_value={"speech": "Hi!", "actions": []},
-        )
-        result = assistant.process("Hello")
+        with patch.object(assistant, "_process_ollama", return_value=_OK_RESPONSE) as mock_ollama:
+            result = assistant.process("Hello")
         mock_ollama.assert_called_once_with("Hello")
         assert result["speech"] == "Hi!"
 
     def test_process_claude_calls_claude(self, mocker):
         """Process with use_local=False calls _process_claude."""
-        assistant = Assistant(use_local=True)
-        assistant.use_local = False  # Override to avoid needing Anthropic import
+        assistant = _bare_assistant(use_local=False)
         mock_claude = mocker.patch.object(
             assistant,
             "_process_claude",
-            return_value={"speech": "Hi from Claude!", "actions": []},
+            return_value=_CLAUDE_OK,
         )
         result = assistant.process("Hello")
         mock_claude.assert_called_once_with("Hello")
         assert result["speech"] == "Hi from Claude!"
 
-    def test_process_exception_returns_error(self, mocker):
+    def test_process_exception_returns_error(self):
         """Exceptions during processing return an error message."""
         assistant = Assistant(use_local=True)
-        mocker.patch.object(
-            assistant,
-            "_process_ollama",
-            side_effect=Exception("Connection refused"),
-        )
+        # The instance is discarded after the test, so no patch teardown is needed
+        assistant._process_ollama = _raise_connection_refused
         result = assistant.process("Hello")
         assert "error" in result["speech"].lower()
         assert "Connection refused" in result["speech"]
@@ -253,34 +259,25 @@ class TestProcess:
 
     def test_process_adds_user_to_history(self, mocker):
         """User input is added to history before processing."""
-        assistant = Assistant(use_local=True)
+        assistant = _bare_assistant()
         mocker.patch.object(
             assistant,
             "_process_ollama",
-            return_value={"speech": "Hi!", "actions": []},
+            return_value=_OK_RESPONSE,
         )
         assistant.process("Hello there")
-        # History should have the user message (added by process)
-        # and the assistant response (added by _parse_response, but we mocked _process_ollama)
-        assert any(
-            msg["role"] == "user" and msg["content"] == "Hello there"
-            for msg in assistant.conversation_history
-        )
+        # Only the user message is recorded; the assistant reply would come from
+        # _parse_response, which the mocked _process_ollama never reaches
+        assert assistant.conversation_history == [{"role": "user", "content": "Hello there"}]
 
-    def test_process_dev_mode_enriches_input(self, mocker):
+    def test_process_dev_mode_enriches_input(self):
         """In dev mode, memory context is prepended to user input."""
-        assistant = Assistant(use_local=True, dev_mode=True)
-        mocker.patch.object(
-            assistant,
-            "_get_memory_context",
-            return_value="[Memory: React patterns]",
-        )
-        mock_ollama = mocker.patch.object(
-            assistant,
-            "_process_ollama",
-            return_value={"speech": "Done.", "actions": []},
-        )
-        assistant.process("Tell me about React")
+        assistant = _bare_assistant(dev_mode=True)
+        with (
+            patch.object(assistant, "_get_memory_context", return_value="[Memory: React patterns]"),
+            patch.object(assistant, "_process_ollama", return_value=_DONE) as mock_ollama,
+        ):
+            assistant.process("Tell me about React")
         # The enriched input should contain memory context + user request
         call_arg = mock_ollama.call_args[0][0]
         assert "[Memory: React patterns]" in call_arg
@@ -288,7 +285,7 @@ class TestProcess:
 
     def test_process_dev_mode_no_memory_context(self, mocker):
         """In dev mode with empty memory context, input is not enriched."""
-        assistant = Assistant(use_local=True, dev_mode=True)
+        assistant = _bare_assistant(dev_mode=True)
         mocker.patch.object(
             assistant,
             "_get_memory_context",
@@ -297,7 +294,7 @@ class TestProcess:
         mock_ollama = mocker.patch.object(
             assistant,
             "_process_ollama",
-            return_value={"speech": "Done.", "actions": []},
+            return_value=_DONE,
         )
         assistant.process("Hello")
         call_arg = mock_ollama.call_args[0][0]
@@ -320,31 +317,37 @@ class TestClearHistory:
 class TestProcessOllama:
     """Test _process_ollama makes correct HTTP requests."""
 
-    def test_process_ollama_success(self, mocker):
+    @pytest.fixture
+    def mock_post(self, mocker):
+        """Patch requests.post with a successful, empty Ollama reply."""
+        # _process_ollama only reads .status_code and .json(); a plain namespace
+        # is enough and avoids MagicMock's child-mock machinery
+        response = SimpleNamespace(
+            status_code=200,
+            json=lambda: {"message": {"content": '{"speech": "", "actions": []}'}},
+        )
+        return mocker.patch("synthia.assistant.requests.post", return_value=response)
+
+    def test_process_ollama_success(self, mock_post):
         """Successful Ollama API call returns parsed response."""
         assistant = Assistant(use_local=True, local_model="test-model")
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_post.return_value.json = lambda: {
             "message": {"content": '{"speech": "Hello!", "actions": []}'}
         }
-        mocker.patch("synthia.assistant.requests.post", return_value=mock_response)
 
         result = assistant._process_ollama("Hi")
         assert result["speech"] == "Hello!"
         assert result["actions"] == []
 
-    def test_process_ollama_error_status(self, mocker):
+    def test_process_ollama_error_status(self, mock_post):
         """Non-200 status from Ollama raises an exception."""
         assistant = Assistant(use_local=True)
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mocker.patch("synthia.assistant.requests.post", return_value=mock_response)
+        mock_post.return_value.status_code = 500
 
         with pytest.raises(Exception, match="Ollama error: 500"):
             assistant._process_ollama("Hi")
 
-    def test_process_ollama_sends_correct_payload(self, mocker):
+    def test_process_ollama_sends_correct_payload(self, mock_post):
         """Ollama API call includes system prompt, conversation, and model config."""
         assistant = Assistant(
             use_local=True,
@@ -353,13 +356,6 @@ class TestProcessOllama:
         )
         assistant._add_to_history("user", "Previous message")
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "message": {"content": '{"speech": "OK", "actions": []}'}
-        }
-        mock_post = mocker.patch("synthia.assistant.requests.post", return_value=mock_response)
-
         assistant._process_ollama("New message")
 
         mock_post.assert_called_once()
@@ -381,6 +377,6 @@ class TestSystemPrompt:
 
     def test_system_prompt_formats_correctly(self):
         """SYSTEM_PROMPT can be formatted with a date string."""
-        formatted = SYSTEM_PROMPT.format(date="Monday, January 01, 2025 at 10:00 AM")
-        assert "Monday, January 01, 2025 at 10:00 AM" in formatted
+        formatted = SYSTEM_PROMPT.format(date=_PROMPT_DATE)
+        assert _PROMPT_DATE in formatted
         assert "{date}" not in formatted
@@ -1,6 +1,8 @@
 """Tests for synthia.clipboard_monitor module."""
 
+import base64
 import hashlib
+import io
 import json
 import os
 import subprocess
@@ -8,6 +10,7 @@ import threading
 import time
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
@@ -78,6 +81,16 @@ class TestClipboardMonitorInit:
         assert len(monitor.history) == 1
         assert monitor.history[0]["content"] == "test"
 
+    def test_init_loads_history_without_orjson(self, tmp_path, monkeypatch):
+        """History still loads through the stdlib json fallback."""
+        monkeypatch.setattr("synthia._jsonio.HAS_ORJSON", False)
+        history_file = tmp_path / "history.json"
+        history_file.write_text(json.dumps([{"id": 1, "content": "test", "hash": "abc"}]))
+
+        monitor = ClipboardMonitor(history_file=str(history_file))
+
+        assert monitor.history[0]["content"] == "test"
+
     def test_init_handles_missing_history_file(self, tmp_path):
         """ClipboardMonitor handles missing history file gracefully."""
         history_file = tmp_path / "nonexistent.json"
@@ -99,13 +112,13 @@ class TestClipboardMonitorInit:
 class TestContentHash:
     """Tests for _content_hash method."""
 
-    def test_returns_sha256_hash(self, tmp_path, monkeypatch):
-        """_content_hash returns SHA-256 hash of content."""
+    def test_returns_blake2b_hash(self, tmp_path, monkeypatch):
+        """_content_hash returns a 64-bit BLAKE2b hash of content."""
         monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
         monitor = ClipboardMonitor()
 
         content = "test content"
-        expected_hash = hashlib.sha256(content.encode()).hexdigest()
+        expected_hash = hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
 
         result = monitor._content_hash(content)
 
@@ -140,7 +153,7 @@ class TestContentHash:
 
         result = monitor._content_hash("test")
 
-        assert len(result) == 64  # SHA-256 hex is 64 chars
+        assert len(result) == 16  # 8-byte BLAKE2b digest is 16 hex chars
         assert all(c in "0123456789abcdef" for c in result)
 
 
@@ -209,6 +222,18 @@ class TestAddItem:
 
         assert len(monitor.history) == 1
 
+    def test_same_as_last_is_not_rehashed(self, tmp_path, monkeypatch):
+        """Unchanged clipboard content skips hashing entirely."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        monitor = ClipboardMonitor()
+        monitor._add_item("content")
+
+        with patch.object(monitor, "_content_hash") as mock_hash:
+            monitor._add_item("  content\n")
+
+        mock_hash.assert_not_called()
+        assert len(monitor.history) == 1
+
     def test_trims_to_max_items(self, tmp_path, monkeypatch):
         """_add_item trims history to max_items."""
         monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
@@ -222,6 +247,18 @@ class TestAddItem:
         assert monitor.history[1]["content"] == "content3"
         assert monitor.history[2]["content"] == "content2"
 
+    def test_updates_history_list_in_place(self, tmp_path, monkeypatch):
+        """Dedup and trimming edit the existing list rather than rebuilding it."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        monitor = ClipboardMonitor(max_items=2)
+        history = monitor.history
+
+        for content in ("a", "b", "a", "c"):
+            monitor._add_item(content)
+
+        assert monitor.history is history
+        assert [h["content"] for h in history] == ["c", "a"]
+
     def test_item_has_required_fields(self, tmp_path, monkeypatch):
         """Added items have id, content, timestamp, and hash."""
         monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
@@ -258,10 +295,12 @@ class TestAddItem:
         # Should be parseable as ISO format
         datetime.fromisoformat(timestamp)
 
-    def test_saves_history_file(self, tmp_path, monkeypatch):
-        """_add_item saves history to file."""
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_saves_history_file(self, tmp_path, monkeypatch, has_orjson):
+        """_add_item saves history to file as JSON, with or without orjson."""
         history_file = tmp_path / "history.json"
         monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        monkeypatch.setattr("synthia._jsonio.HAS_ORJSON", has_orjson)
         monitor = ClipboardMonitor(history_file=str(history_file))
 
         monitor._add_item("test")
@@ -286,6 +325,60 @@ class TestAddItem:
             mode = stat_info.st_mode & 0o777
             assert mode == 0o600
 
+    def test_save_is_atomic(self, tmp_path, monkeypatch):
+        """A failed write leaves the previous history file untouched."""
+        history_file = tmp_path / "history.json"
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        monitor = ClipboardMonitor(history_file=str(history_file))
+        monitor._add_item("first")
+        before = history_file.read_bytes()
+
+        with patch("synthia.clipboard_monitor.os.write", side_effect=OSError("disk full")):
+            monitor._add_item("second")
+
+        assert history_file.read_bytes() == before
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["history.json"]
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+    def test_stale_tmp_file_does_not_loosen_permissions(self, tmp_path):
+        """A leftover 0o644 temp file next to the history is not reused."""
+        history_file = tmp_path / "history.json"
+        stale = tmp_path / "history.json.tmp"
+        stale.write_text("stale")
+        stale.chmod(0o644)
+        monitor = ClipboardMonitor(history_file=str(history_file))
+
+        monitor._add_item("secret")
+
+        assert os.stat(history_file).st_mode & 0o777 == 0o600
+        assert stale.read_text() == "stale"
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX symlinks")
+    def test_symlinked_tmp_file_is_not_followed(self, tmp_path):
+        """A symlink planted at the old temp name never receives clipboard data."""
+        history_file = tmp_path / "history.json"
+        target = tmp_path / "elsewhere.txt"
+        target.write_text("untouched")
+        (tmp_path / "history.json.tmp").symlink_to(target)
+        monitor = ClipboardMonitor(history_file=str(history_file))
+
+        monitor._add_item("secret")
+
+        assert target.read_text() == "untouched"
+        assert json.loads(history_file.read_text())[0]["content"] == "secret"
+
+    def test_serialization_error_is_logged(self, tmp_path):
+        """A history that can't be serialized is logged, not raised."""
+        history_file = tmp_path / "history.json"
+        monitor = ClipboardMonitor(history_file=str(history_file))
+        monitor.history = [{"content": object()}]
+
+        with patch("synthia.clipboard_monitor.logger") as mock_logger:
+            monitor._save_history()
+
+        mock_logger.warning.assert_called_once()
+        assert not history_file.exists()
+
 
 class TestStartStop:
     """Tests for start and stop methods."""
@@ -410,6 +503,54 @@ class TestStartStop:
         mock_thread.join.assert_called_once()
 
 
+def _frame(data: bytes) -> bytes:
+    """Encode a snapshot the way WL_PASTE_WATCH_CMD prints it."""
+    return base64.b64encode(data) + b"\n"
+
+
+class TestRunWaylandMonitor:
+    """Tests for _run_wayland_monitor."""
+
+    def test_streams_snapshots_from_one_wl_paste(self, tmp_path, monkeypatch):
+        """A single wl-paste --watch feeds every base64-framed snapshot."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        stream = _frame(b"one") + _frame(b"multi\nline") + base64.b64encode(b"partial")
+        process = Mock(stdout=io.BytesIO(stream))
+        mock_popen = Mock(return_value=process)
+        monitor = ClipboardMonitor(runner=SimpleNamespace(Popen=mock_popen))
+        monitor.running = True
+
+        def stop(_seconds):
+            monitor.running = False
+
+        monkeypatch.setattr("synthia.clipboard_monitor.time.sleep", stop)
+
+        monitor._run_wayland_monitor()
+
+        mock_popen.assert_called_once()
+        assert "--watch" in mock_popen.call_args[0][0]
+        assert [h["content"] for h in monitor.history] == ["multi\nline", "one"]
+
+    def test_binary_snapshots_are_skipped(self, tmp_path, monkeypatch):
+        """Non-text data (e.g. image bytes) never reaches the history."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        png = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\xff\xfe"
+        process = Mock(stdout=io.BytesIO(_frame(b"kept") + _frame(png) + b"not base64!\n"))
+        mock_popen = Mock(return_value=process)
+        monitor = ClipboardMonitor(runner=SimpleNamespace(Popen=mock_popen))
+        monitor.running = True
+
+        def stop(_seconds):
+            monitor.running = False
+
+        monkeypatch.setattr("synthia.clipboard_monitor.time.sleep", stop)
+
+        monitor._run_wayland_monitor()
+
+        assert "--type" in mock_popen.call_args[0][0]
+        assert [h["content"] for h in monitor.history] == ["kept"]
+
+
 class TestGetHistory:
     """Tests for get_history method."""
 
@@ -509,11 +650,10 @@ class TestCopyToClipboard:
         """_copy_to_clipboard uses wl-copy on Wayland."""
         monkeypatch.setenv("WAYLAND_DISPLAY", "wayland-0")
         monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
-        monitor = ClipboardMonitor()
 
         mock_popen = Mock()
         mock_popen.communicate = Mock()
-        monkeypatch.setattr("subprocess.Popen", mock_popen)
+        monitor = ClipboardMonitor(runner=SimpleNamespace(Popen=mock_popen))
 
         monitor._copy_to_clipboard("test")
 
@@ -526,11 +666,10 @@ class TestCopyToClipboard:
         monkeypatch.delenv("WAYLAND_DISPLAY", raising=False)
         monkeypatch.setenv("DISPLAY", ":0")
         monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
-        monitor = ClipboardMonitor()
 
         mock_popen = Mock()
         mock_popen.communicate = Mock()
-        monkeypatch.setattr("subprocess.Popen", mock_popen)
+        monitor = ClipboardMonitor(runner=SimpleNamespace(Popen=mock_popen))
 
         monitor._copy_to_clipboard("test")
 
@@ -542,11 +681,10 @@ class TestCopyToClipboard:
         """_copy_to_clipboard returns True on success."""
         monkeypatch.setenv("WAYLAND_DISPLAY", "wayland-0")
         monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
-        monitor = ClipboardMonitor()
 
         mock_popen = Mock()
         mock_popen.communicate = Mock()
-        monkeypatch.setattr("subprocess.Popen", mock_popen)
+        monitor = ClipboardMonitor(runner=SimpleNamespace(Popen=mock_popen))
 
         result = monitor._copy_to_clipboard("test")
 
@@ -556,9 +694,10 @@ class TestCopyToClipboard:
         """_copy_to_clipboard returns False on exception."""
         monkeypatch.setenv("WAYLAND_DISPLAY", "wayland-0")
         monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
-        monitor = ClipboardMonitor()
 
-        monkeypatch.setattr("subprocess.Popen", Mock(side_effect=FileNotFoundError()))
+        monitor = ClipboardMonitor(
+            runner=SimpleNamespace(Popen=Mock(side_effect=FileNotFoundError()))
+        )
 
         result = monitor._copy_to_clipboard("test")
 
@@ -568,11 +707,10 @@ class TestCopyToClipboard:
         """_copy_to_clipboard passes content to process stdin."""
         monkeypatch.setenv("WAYLAND_DISPLAY", "wayland-0")
         monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
-        monitor = ClipboardMonitor()
 
         mock_process = Mock()
         mock_popen = Mock(return_value=mock_process)
-        monkeypatch.setattr("subprocess.Popen", mock_popen)
+        monitor = ClipboardMonitor(runner=SimpleNamespace(Popen=mock_popen))
 
         monitor._copy_to_clipboard("test content")
 
@@ -589,10 +727,9 @@ class TestGetClipboardContent:
         """_get_clipboard_content uses wl-paste on Wayland."""
         monkeypatch.setenv("WAYLAND_DISPLAY", "wayland-0")
         monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
-        monitor = ClipboardMonitor()
 
         mock_run = Mock(return_value=Mock(returncode=0, stdout="content"))
-        monkeypatch.setattr("subprocess.run", mock_run)
+        monitor = ClipboardMonitor(runner=SimpleNamespace(run=mock_run))
 
         result = monitor._get_clipboard_content()
 
@@ -604,10 +741,9 @@ class TestGetClipboardContent:
         monkeypatch.delenv("WAYLAND_DISPLAY", raising=False)
         monkeypatch.setenv("DISPLAY", ":0")
         monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
-        monitor = ClipboardMonitor()
 
         mock_run = Mock(return_value=Mock(returncode=0, stdout="content"))
-        monkeypatch.setattr("subprocess.run", mock_run)
+        monitor = ClipboardMonitor(runner=SimpleNamespace(run=mock_run))
 
         result = monitor._get_clipboard_content()
 
@@ -618,10 +754,9 @@ class TestGetClipboardContent:
         """_get_clipboard_content returns content when successful."""
         monkeypatch.setenv("WAYLAND_DISPLAY", "wayland-0")
         monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
-        monitor = ClipboardMonitor()
 
         mock_run = Mock(return_value=Mock(returncode=0, stdout="clipboard content"))
-        monkeypatch.setattr("subprocess.run", mock_run)
+        monitor = ClipboardMonitor(runner=SimpleNamespace(run=mock_run))
 
         result = monitor._get_clipboard_content()
 
@@ -631,23 +766,30 @@ class TestGetClipboardContent:
         """_get_clipboard_content returns None on failure."""
         monkeypatch.setenv("WAYLAND_DISPLAY", "wayland-0")
         monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
-        monitor = ClipboardMonitor()
 
         mock_run = Mock(side_effect=FileNotFoundError())
-        monkeypatch.setattr("subprocess.run", mock_run)
+        monitor = ClipboardMonitor(runner=SimpleNamespace(run=mock_run))
 
         result = monitor._get_clipboard_content()
 
         assert result is None
 
+    def test_real_subprocess_missing_tool_returns_none(self, tmp_path, monkeypatch):
+        """With the real subprocess module, a missing clipboard tool yields None."""
+        monkeypatch.setenv("WAYLAND_DISPLAY", "wayland-0")
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        monkeypatch.setenv("PATH", str(tmp_path))  # No wl-paste on PATH
+        monitor = ClipboardMonitor()
+
+        assert monitor._get_clipboard_content() is None
+
     def test_returns_none_on_nonzero_returncode(self, tmp_path, monkeypatch):
         """_get_clipboard_content returns None when returncode != 0."""
         monkeypatch.setenv("WAYLAND_DISPLAY", "wayland-0")
         monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
-        monitor = ClipboardMonitor()
 
         mock_run = Mock(return_value=Mock(returncode=1, stdout=""))
-        monkeypatch.setattr("subprocess.run", mock_run)
+        monitor = ClipboardMonitor(runner=SimpleNamespace(run=mock_run))
 
         result = monitor._get_clipboard_content()
 
@@ -83,6 +83,8 @@ class TestAddInboxItem:
 
         items = inbox.load_inbox()
         assert len(items) == 50
+        assert items[0]["filename"] == "file_54.txt"
+        assert items[-1]["filename"] == "file_5.txt"
 
     def test_inserts_at_front(self, inbox_dir):
         """New items are inserted at the front (newest first)."""
@@ -96,6 +98,34 @@ class TestAddInboxItem:
         assert items[2]["filename"] == "first.txt"
 
 
+class TestAddInboxItems:
+    """Tests for add_inbox_items function."""
+
+    def test_adds_all_entries_newest_first(self, inbox_dir):
+        """Bulk add stores every entry, last entry first."""
+        inbox.add_inbox_item(item_type="file", filename="existing.txt")
+
+        added = inbox.add_inbox_items(
+            [
+                {"item_type": "url", "filename": "a", "url": "https://a.example"},
+                {"item_type": "url", "filename": "b", "url": "https://b.example"},
+            ]
+        )
+
+        assert [item["filename"] for item in added] == ["a", "b"]
+        items = inbox.load_inbox()
+        assert [item["filename"] for item in items] == ["b", "a", "existing.txt"]
+        assert items[0]["url"] == "https://b.example"
+
+    def test_saves_once(self, inbox_dir):
+        """Bulk add writes the inbox file a single time."""
+        with patch.object(inbox, "save_inbox") as mock_save:
+            inbox.add_inbox_items([{"item_type": "url", "filename": str(i)} for i in range(5)])
+
+        mock_save.assert_called_once()
+        assert len(mock_save.call_args[0][0]) == 5
+
+
 class TestMarkItemOpened:
     """Tests for mark_item_opened function."""
 
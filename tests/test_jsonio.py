@@ -0,0 +1,38 @@
+"""Tests for synthia._jsonio module."""
+
+import json
+
+import pytest
+
+from synthia._jsonio import json_dumps_bytes, json_loads
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with and without orjson."""
+    if request.param:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr("synthia._jsonio.HAS_ORJSON", request.param)
+
+
+class TestJsonIO:
+    """Tests for json_loads and json_dumps_bytes."""
+
+    def test_round_trip(self, backend):
+        """Data survives a dump and load unchanged."""
+        data = {"tasks": [{"id": "1", "title": "café", "done": False}]}
+
+        assert json_loads(json_dumps_bytes(data)) == data
+
+    def test_dumps_indented_bytes_readable_by_stdlib(self, backend):
+        """Output is indented UTF-8 JSON that the stdlib json module can read."""
+        payload = json_dumps_bytes({"a": [1, 2]})
+
+        assert isinstance(payload, bytes)
+        assert b'\n  "a"' in payload
+        assert json.loads(payload) == {"a": [1, 2]}
+
+    def test_invalid_input_raises_json_decode_error(self, backend):
+        """Both backends raise json.JSONDecodeError on bad input."""
+        with pytest.raises(json.JSONDecodeError):
+            json_loads(b"{not json")
@@ -21,6 +21,11 @@ from synthia.output import (
 class TestTypeText:
     """Tests for type_text function."""
 
+    @pytest.fixture(autouse=True)
+    def _backends_available(self, monkeypatch):
+        """Pretend all typing tools are installed."""
+        monkeypatch.setattr(output, "_TYPING_BACKENDS", ["wtype", "ydotool", "xdotool"])
+
     def test_returns_false_for_empty_text(self, clean_env, monkeypatch):
         """type_text returns False when passed empty string."""
         monkeypatch.setenv("WAYLAND_DISPLAY", "wayland-0")
@@ -100,6 +105,30 @@ class TestTypeText:
 
         assert type_text("test") is False
 
+    def test_fast_fails_without_backends(self, clean_env, monkeypatch, caplog):
+        """With no typing tool installed, returns False without spawning anything."""
+        monkeypatch.setenv("DISPLAY", ":0")
+        monkeypatch.setattr(output, "_TYPING_BACKENDS", [])
+        monkeypatch.setattr(output, "_warned_no_backend", False)
+        mock_run = Mock()
+        monkeypatch.setattr("subprocess.run", mock_run)
+
+        with caplog.at_level("WARNING", logger="synthia.output"):
+            assert type_text("test") is False
+            assert type_text("again") is False
+
+        mock_run.assert_not_called()
+        assert caplog.text.count("No typing tool found") == 1
+
+    def test_wezterm_still_used_without_backends(self, clean_env, monkeypatch):
+        """On Wayland, wezterm CLI is still tried when no typing tool is installed."""
+        monkeypatch.setenv("WAYLAND_DISPLAY", "wayland-0")
+        monkeypatch.setattr(output, "_TYPING_BACKENDS", [])
+        monkeypatch.setattr(output, "_get_wezterm_cmd", lambda: ["wezterm"])
+        monkeypatch.setattr(output, "_type_with_wezterm_cli", lambda x: True)
+
+        assert type_text("test") is True
+
 
 class TestFindWeztermCli:
     """Tests for _find_wezterm_cli function."""
@@ -372,8 +401,8 @@ class TestTypeWithWtype:
         assert result is True
         mock_run.assert_called_once()
         call_args = mock_run.call_args[0][0]
-        assert call_args[0] == "wtype"
-        assert "hello world" in call_args
+        assert call_args == ["wtype", "-"]
+        assert mock_run.call_args[1]["input"] == b"hello world"
 
     def test_returns_false_when_wtype_not_found(self, monkeypatch):
         """Returns False when wtype binary not found."""
@@ -423,9 +452,8 @@ class TestTypeWithYdotool:
         assert result is True
         mock_run.assert_called_once()
         call_args = mock_run.call_args[0][0]
-        assert call_args[0] == "ydotool"
-        assert "type" in call_args
-        assert "hello world" in call_args
+        assert call_args == ["ydotool", "type", "--file", "-"]
+        assert mock_run.call_args[1]["input"] == b"hello world"
 
     def test_returns_false_when_ydotool_not_found(self, monkeypatch):
         """Returns False when ydotool binary not found."""
@@ -1,6 +1,7 @@
 """Tests for synthia.sounds module."""
 
-import os
+import subprocess
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -13,9 +14,9 @@ from synthia.sounds import (
     FREQ_ERROR,
     FREQ_HIGH,
     FREQ_LOW,
-    MAX_TEMP_FILES,
     SoundEffects,
     _generate_beep,
+    _generate_beep_pcm,
 )
 
 
@@ -75,121 +76,78 @@ class TestGenerateBeep:
         assert quiet != loud
 
 
-class TestSoundEffectsInit:
-    """Tests for SoundEffects.__init__."""
+class TestGenerateBeepPcm:
+    """Tests for _generate_beep_pcm."""
 
-    @patch("synthia.sounds.atexit.register")
-    def test_init_registers_atexit_cleanup(self, mock_register):
-        """__init__ should register the cleanup method with atexit."""
-        effects = SoundEffects(enabled=False)
-        mock_register.assert_called_once_with(effects.cleanup)
+    def test_matches_wav_payload(self):
+        """The raw PCM should be exactly the WAV payload after the header."""
+        pcm = _generate_beep_pcm(440, 100, 0.5)
+        assert _generate_beep(440, 100, 0.5)[44:] == pcm
+
+    def test_length(self):
+        """Each 16-bit mono sample should take 2 bytes."""
+        pcm = _generate_beep_pcm(440, 100)
+        assert len(pcm) == int(BEEP_SAMPLE_RATE * 100 / 1000) * 2
 
-    @patch("synthia.sounds.atexit.register")
-    def test_init_creates_temp_files_list(self, mock_register):
-        """__init__ should initialize an empty _temp_files list."""
-        effects = SoundEffects(enabled=False)
-        assert effects._temp_files == []
 
-    @patch("synthia.sounds.atexit.register")
-    def test_init_stores_enabled_flag(self, mock_register):
+class TestSoundEffectsInit:
+    """Tests for SoundEffects.__init__."""
+
+    def test_init_stores_enabled_flag(self):
         """__init__ should store the enabled parameter."""
         effects_on = SoundEffects(enabled=True)
         effects_off = SoundEffects(enabled=False)
         assert effects_on.enabled is True
         assert effects_off.enabled is False
 
-    @patch("synthia.sounds.atexit.register")
-    def test_init_pregenerates_sounds(self, mock_register):
-        """__init__ should pre-generate all three sound effects."""
+    def test_init_pregenerates_sounds(self):
+        """__init__ should pre-generate all three sound effects as raw PCM."""
         effects = SoundEffects(enabled=False)
-        assert isinstance(effects._start_sound, bytes)
-        assert isinstance(effects._stop_sound, bytes)
-        assert isinstance(effects._error_sound, bytes)
-        # All should be valid WAV
-        assert effects._start_sound[:4] == b"RIFF"
-        assert effects._stop_sound[:4] == b"RIFF"
-        assert effects._error_sound[:4] == b"RIFF"
-
-    @patch("synthia.sounds.atexit.register")
-    def test_init_default_enabled(self, mock_register):
+        assert effects._start_pcm == _generate_beep_pcm(FREQ_HIGH, DURATION_SHORT, BEEP_VOLUME)
+        assert effects._stop_pcm == _generate_beep_pcm(FREQ_LOW, DURATION_SHORT, BEEP_VOLUME)
+        assert effects._error_pcm == _generate_beep_pcm(FREQ_ERROR, DURATION_LONG, BEEP_VOLUME)
+
+    def test_init_default_enabled(self):
         """Default enabled parameter should be True."""
         effects = SoundEffects()
         assert effects.enabled is True
 
 
-class TestSoundEffectsCleanup:
-    """Tests for SoundEffects.cleanup."""
-
-    @patch("synthia.sounds.atexit.register")
-    def test_cleanup_removes_temp_files(self, mock_register, tmp_path):
-        """cleanup should remove all tracked temp files."""
-        effects = SoundEffects(enabled=False)
-
-        # Create real temp files to clean up
-        temp_files = []
-        for i in range(3):
-            f = tmp_path / f"test_{i}.wav"
-            f.write_bytes(b"fake wav data")
-            temp_files.append(str(f))
-
-        effects._temp_files = temp_files
-
-        effects.cleanup()
-
-        for f in temp_files:
-            assert not os.path.exists(f)
-
-    @patch("synthia.sounds.atexit.register")
-    def test_cleanup_resets_temp_files_list(self, mock_register, tmp_path):
-        """cleanup should reset _temp_files to an empty list."""
-        effects = SoundEffects(enabled=False)
-
-        f = tmp_path / "test.wav"
-        f.write_bytes(b"fake wav data")
-        effects._temp_files = [str(f)]
-
-        effects.cleanup()
-
-        assert effects._temp_files == []
-
-    @patch("synthia.sounds.atexit.register")
-    def test_cleanup_handles_missing_files_gracefully(self, mock_register):
-        """cleanup should not raise if temp files are already gone."""
-        effects = SoundEffects(enabled=False)
-        effects._temp_files = ["/nonexistent/file.wav"]
-
-        # Should not raise
-        effects.cleanup()
-        assert effects._temp_files == []
-
-    @patch("synthia.sounds.atexit.register")
-    def test_cleanup_with_no_temp_files(self, mock_register):
-        """cleanup should work fine when there are no temp files."""
-        effects = SoundEffects(enabled=False)
-        assert effects._temp_files == []
-
-        # Should not raise
-        effects.cleanup()
-        assert effects._temp_files == []
-
-
 class TestSoundEffectsPlayback:
     """Tests for SoundEffects play methods."""
 
-    @patch("synthia.sounds.atexit.register")
     @patch("synthia.sounds.subprocess.Popen")
-    def test_play_start_writes_and_plays(self, mock_popen, mock_register, tmp_path):
-        """play_start should write a temp WAV file and call paplay."""
+    def test_play_start_streams_pcm_to_paplay(self, mock_popen):
+        """play_start should pipe the PCM into paplay --raw."""
         effects = SoundEffects(enabled=True)
         effects.play_start()
+        effects._queue.join()
 
         mock_popen.assert_called_once()
         call_args = mock_popen.call_args
-        assert call_args[0][0][0] == "paplay"
+        cmd = call_args[0][0]
+        assert cmd[:2] == ["paplay", "--raw"]
+        assert f"--rate={BEEP_SAMPLE_RATE}" in cmd
+        assert "--channels=1" in cmd
+        assert call_args[1]["stdin"] == subprocess.PIPE
+
+        stdin = mock_popen.return_value.stdin
+        stdin.write.assert_called_once_with(effects._start_pcm)
+        stdin.close.assert_called_once()
 
-    @patch("synthia.sounds.atexit.register")
     @patch("synthia.sounds.subprocess.Popen")
-    def test_play_does_nothing_when_disabled(self, mock_popen, mock_register):
+    def test_play_stop_and_error_use_their_sounds(self, mock_popen):
+        """play_stop and play_error should stream their own PCM."""
+        effects = SoundEffects(enabled=True)
+        effects.play_stop()
+        effects.play_error()
+        effects._queue.join()
+
+        written = [c[0][0] for c in mock_popen.return_value.stdin.write.call_args_list]
+        assert written == [effects._stop_pcm, effects._error_pcm]
+
+    @patch("synthia.sounds.subprocess.Popen")
+    def test_play_does_nothing_when_disabled(self, mock_popen):
         """Play methods should do nothing when enabled is False."""
         effects = SoundEffects(enabled=False)
         effects.play_start()
@@ -197,36 +155,50 @@ class TestSoundEffectsPlayback:
         effects.play_error()
 
         mock_popen.assert_not_called()
+        assert effects._worker is None
 
-    @patch("synthia.sounds.atexit.register")
-    @patch("synthia.sounds.subprocess.Popen")
-    def test_play_tracks_temp_files(self, mock_popen, mock_register):
-        """Playing a sound should track the temp file for later cleanup."""
+    @patch("synthia.sounds.subprocess.Popen", side_effect=FileNotFoundError("paplay"))
+    def test_play_handles_missing_paplay(self, mock_popen):
+        """A missing paplay should be logged, not raised."""
         effects = SoundEffects(enabled=True)
         effects.play_start()
+        effects._queue.join()
 
-        assert len(effects._temp_files) == 1
-        assert effects._temp_files[0].endswith(".wav")
+        # The worker survives the error and keeps serving requests
+        effects.play_stop()
+        effects._queue.join()
+        assert mock_popen.call_count == 2
 
-    @patch("synthia.sounds.atexit.register")
     @patch("synthia.sounds.subprocess.Popen")
-    def test_play_cleans_old_files_when_exceeding_max(self, mock_popen, mock_register, tmp_path):
-        """When temp files exceed MAX_TEMP_FILES, oldest should be removed."""
+    def test_play_returns_before_spawning(self, mock_popen):
+        """play_* only enqueues; paplay is spawned on the worker thread."""
         effects = SoundEffects(enabled=True)
+        callers = []
+        mock_popen.side_effect = lambda *a, **k: callers.append(threading.current_thread())
 
-        # Pre-populate with MAX_TEMP_FILES existing entries
-        existing_files = []
-        for i in range(MAX_TEMP_FILES):
-            f = tmp_path / f"old_{i}.wav"
-            f.write_bytes(b"fake")
-            existing_files.append(str(f))
-
-        effects._temp_files = list(existing_files)
-
-        # Play one more to trigger cleanup of the oldest
         effects.play_start()
+        effects._queue.join()
+
+        assert callers == [effects._worker]
 
-        # The first old file should have been removed
-        assert not os.path.exists(existing_files[0])
-        # List should still be MAX_TEMP_FILES long (removed 1 old, added 1 new)
-        assert len(effects._temp_files) == MAX_TEMP_FILES
+    @patch("synthia.sounds.subprocess.Popen")
+    def test_concurrent_first_plays_start_one_worker(self, mock_popen):
+        """Simultaneous first calls from several threads share one worker."""
+        effects = SoundEffects(enabled=True)
+        barrier = threading.Barrier(8)
+
+        def play():
+            barrier.wait()
+            effects.play_start()
+
+        with patch("synthia.sounds.threading.Thread", wraps=threading.Thread) as thread_cls:
+            threads = [threading.Thread(target=play) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            effects._queue.join()
+
+        worker_starts = [c for c in thread_cls.call_args_list if c.kwargs.get("daemon")]
+        assert len(worker_starts) == 1
+        assert mock_popen.call_count == 8
@@ -1,6 +1,10 @@
 """Tests for the task functions in src/synthia/tasks_cli.py."""
 
 import json
+import os
+import subprocess
+import sys
+import uuid
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
@@ -90,6 +94,24 @@ class TestSaveTasks:
         assert loaded["tasks"][0]["title"] == "Saved task"
         assert loaded["tasks"][0]["status"] == "in_progress"
 
+    def test_save_tasks_leaves_no_temp_file(self, tmp_tasks_file: Path, monkeypatch):
+        """Save tasks renames its temp file over the store."""
+        monkeypatch.setattr("synthia.tasks_cli.TASKS_FILE", tmp_tasks_file)
+
+        save_tasks({"tasks": [{"id": "a", "title": "One"}]})
+
+        assert [p.name for p in tmp_tasks_file.parent.iterdir()] == ["tasks.json"]
+
+    def test_save_and_load_without_orjson(self, tmp_tasks_file: Path, monkeypatch):
+        """The stdlib json fallback round-trips the same data."""
+        monkeypatch.setattr("synthia.tasks_cli.TASKS_FILE", tmp_tasks_file)
+        monkeypatch.setattr("synthia._jsonio.HAS_ORJSON", False)
+
+        data = {"tasks": [{"id": "a", "title": "Café", "tags": ["x"]}]}
+        save_tasks(data)
+
+        assert load_tasks() == data
+
 
 class TestAddTask:
     """Tests for the add_task function."""
@@ -113,6 +135,18 @@ class TestAddTask:
         assert task["status"] == "todo"
         assert task["completed_at"] is None
 
+    def test_add_task_ids_are_time_ordered_uuid7(self, tmp_tasks_file: Path, monkeypatch):
+        """Task IDs are version 7 UUIDs that sort in creation order."""
+        monkeypatch.setattr("synthia.tasks_cli.TASKS_FILE", tmp_tasks_file)
+
+        with patch("synthia.tasks_cli.time.time_ns", side_effect=[1_000_000_000, 2_000_000_000]):
+            add_task(title="First")
+            add_task(title="Second")
+
+        ids = [t["id"] for t in load_tasks()["tasks"]]
+        assert [uuid.UUID(i).version for i in ids] == [7, 7]
+        assert ids == sorted(ids)
+
     def test_add_task_with_tags_parses_comma_separated_string(
         self, tmp_tasks_file: Path, monkeypatch
     ):
@@ -191,6 +225,20 @@ class TestFindTask:
         assert task is not None
         assert task["title"] == "Implement User Authentication"
 
+    def test_find_task_prefers_id_over_earlier_title_match(self):
+        """An exact ID match wins even when an earlier task's title matches."""
+        data = {
+            "tasks": [
+                {"id": "first", "title": "Mentions target-id in title"},
+                {"id": "target-id", "title": "Other"},
+            ]
+        }
+
+        task = find_task(data, "target-id")
+
+        assert task is not None
+        assert task["id"] == "target-id"
+
     def test_find_task_returns_none_for_no_match(self, tmp_tasks_file: Path, monkeypatch):
         """Find task returns None when no task matches."""
         monkeypatch.setattr("synthia.tasks_cli.TASKS_FILE", tmp_tasks_file)
@@ -769,3 +817,29 @@ class TestMainCliParsing:
 
         captured = capsys.readouterr()
         assert "Unknown command" in captured.out
+
+
+class TestStandaloneScript:
+    """Tests for running tasks_cli.py directly by path."""
+
+    def test_runs_by_path_outside_the_package(self, tmp_path: Path):
+        """The script imports its helpers without synthia being installed."""
+        env = {k: v for k, v in os.environ.items() if k != "PYTHONPATH"}
+        env["HOME"] = str(tmp_path)
+
+        def run(*args: str) -> subprocess.CompletedProcess[str]:
+            return subprocess.run(
+                [sys.executable, str(tasks_cli.__file__), *args],
+                cwd=tmp_path,
+                env=env,
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+
+        added = run("add", "Standalone task")
+        listed = run("list")
+
+        assert added.returncode == 0, added.stderr
+        assert listed.returncode == 0, listed.stderr
+        assert "Standalone task" in listed.stdout
@@ -0,0 +1,63 @@
+"""Tests for synthia.tts module."""
+
+from __future__ import annotations
+
+import pytest
+
+from synthia.tts import TextToSpeech
+
+
+@pytest.fixture
+def tts():
+    """A local-mode TextToSpeech that never touches Google Cloud."""
+    return TextToSpeech(use_local=True)
+
+
+class TestSplitIntoChunks:
+    """Tests for TextToSpeech._split_into_chunks."""
+
+    def test_short_sentences_are_merged(self, tts):
+        """Sentences under the minimum length are joined with the next one."""
+        text = "Hi. Yo. This is a longer sentence that ends. And here is another full one."
+
+        assert tts._split_into_chunks(text) == [
+            "Hi. Yo. This is a longer sentence that ends.",
+            "And here is another full one.",
+        ]
+
+    def test_decimal_point_does_not_split(self, tts):
+        """A period not followed by whitespace is not a sentence boundary."""
+        text = "The value is 3.14 and that is fine. Version 2.0 ships next week as planned."
+
+        assert tts._split_into_chunks(text) == [
+            "The value is 3.14 and that is fine.",
+            "Version 2.0 ships next week as planned.",
+        ]
+
+    def test_trailing_text_without_punctuation_is_kept(self, tts):
+        """Text after the last sentence end becomes its own chunk."""
+        text = "This first sentence is long enough. and then some trailing words"
+
+        assert tts._split_into_chunks(text) == [
+            "This first sentence is long enough.",
+            "and then some trailing words",
+        ]
+
+    def test_whitespace_between_merged_sentences_is_collapsed(self, tts):
+        """Newlines between sentences become a single space inside a chunk."""
+        text = "Hello there.\n\nWhat is up with you today?"
+
+        assert tts._split_into_chunks(text) == ["Hello there. What is up with you today?"]
+
+    def test_long_sentence_falls_back_to_word_boundaries(self, tts):
+        """A chunk longer than max_chars is split between words."""
+        text = "one two three four five six seven eight nine ten"
+
+        chunks = tts._split_into_chunks(text, max_chars=15)
+
+        assert chunks == ["one two three", "four five six", "seven eight", "nine ten"]
+        assert all(len(chunk) <= 15 for chunk in chunks)
+
+    def test_blank_text_is_returned_unchanged(self, tts):
+        """Whitespace-only input yields a single chunk of the original text."""
+        assert tts._split_into_chunks("   ") == ["   "]
@@ -210,6 +210,13 @@ class TestQuickAnswer:
 class TestWebSearchConvenienceFunction:
     """Tests for the web_search convenience function."""
 
+    @pytest.fixture(autouse=True)
+    def fresh_searcher(self):
+        """Drop the shared searcher so each test sees its own mocks."""
+        ws_module._searcher_for_key.cache_clear()
+        yield
+        ws_module._searcher_for_key.cache_clear()
+
     def test_returns_answer_string(self, mocker):
         """web_search returns the quick_answer from a successful search."""
         mock_client_cls = mocker.patch("synthia.web_search.TavilyClient")
@@ -251,3 +258,45 @@ class TestWebSearchConvenienceFunction:
 
         assert "Search error" in result
         assert "Unexpected failure" in result
+
+    def test_reuses_searcher_across_calls(self, mocker):
+        """Repeated searches with the same key share one client."""
+        mocker.patch(
+            "synthia.web_search.load_config",
+            return_value={"tavily_api_key": "tvly-test"},
+        )
+        mock_client_cls = mocker.patch("synthia.web_search.TavilyClient")
+        mock_client_cls.return_value.search.return_value = {"answer": "yes", "results": []}
+
+        web_search("one")
+        web_search("two")
+
+        mock_client_cls.assert_called_once()
+        assert mock_client_cls.return_value.search.call_count == 2
+
+    def test_rotated_key_builds_new_client(self, mocker):
+        """A changed tavily_api_key in config is used on the next search."""
+        config = {"tavily_api_key": "tvly-old"}
+        mocker.patch("synthia.web_search.load_config", return_value=config)
+        mock_client_cls = mocker.patch("synthia.web_search.TavilyClient")
+        mock_client_cls.return_value.search.return_value = {"answer": "ok", "results": []}
+
+        web_search("first")
+        config["tavily_api_key"] = "tvly-new"
+        web_search("second")
+
+        assert [c.kwargs["api_key"] for c in mock_client_cls.call_args_list] == [
+            "tvly-old",
+            "tvly-new",
+        ]
+
+    def test_retries_setup_after_missing_key(self, mocker):
+        """A missing key is not cached; a later call picks up the new config."""
+        config = {"tavily_api_key": ""}
+        mocker.patch("synthia.web_search.load_config", return_value=config)
+        mock_client_cls = mocker.patch("synthia.web_search.TavilyClient")
+        mock_client_cls.return_value.search.return_value = {"answer": "ok", "results": []}
+
+        assert "Tavily API key not configured" in web_search("first")
+        config["tavily_api_key"] = "tvly-new"
+        assert web_search("second") == "ok"
@@ -42,6 +42,26 @@ class TestExtractIssueNumber:
         """Extract issue number from XXX-name pattern."""
         assert extract_issue_number("295-flosale-mobile") == 295
 
+    def test_prefixed_pattern_wins_over_earlier_bare_number(self):
+        """A prefixed pattern anywhere beats the bare-number fallback."""
+        assert extract_issue_number("v2-feature/295-dark-mode") == 295
+
+    def test_bare_number_after_path_segment(self):
+        """The fallback pattern is not anchored to the start."""
+        assert extract_issue_number("users/mark/77-spike") == 77
+
+    def test_leading_number_does_not_beat_prefixed_pattern(self):
+        """A numeric prefix still loses to a later prefixed pattern."""
+        assert extract_issue_number("12-feature/34-x") == 34
+
+    def test_dashed_branch_without_digits_returns_none(self):
+        """Dashed names with no digits never match."""
+        assert extract_issue_number("release-candidate") is None
+
+    def test_non_ascii_digits_still_match(self):
+        """Unicode digits are handled by the regex, not the ASCII prefilter."""
+        assert extract_issue_number("feature/\u0664\u0662-x") == 42
+
     def test_main_branch_returns_none(self):
         """Main branch has no issue number."""
         assert extract_issue_number("main") is None
@@ -176,6 +196,33 @@ class TestWorktreeInfoProgress:
         assert completed == 3
         assert total == 5
 
+    def test_default_tasks_are_shared_empty_tuple(self):
+        """Worktrees without tasks share one empty default instead of a list each."""
+        first = WorktreeInfo(path="/a", branch="main")
+        second = WorktreeInfo(path="/b", branch="main")
+        assert first.tasks == ()
+        assert first.tasks is second.tasks
+
+    def test_progress_follows_reassigned_tasks(self):
+        """Reassigning tasks (as the scanner does) refreshes the counts."""
+        info = WorktreeInfo(path="/p", branch="main")
+        assert info.progress == (0, 0)
+
+        info.tasks = [WorktreeTask(content="T", status="completed", active_form="")]
+        assert info.progress == (1, 1)
+
+        info.tasks.append(WorktreeTask(content="U", status="pending", active_form=""))
+        assert info.progress == (1, 2)
+
+    def test_progress_follows_status_changes(self):
+        """Editing a task's status in place is reflected immediately."""
+        task = WorktreeTask(content="T", status="pending", active_form="")
+        info = WorktreeInfo(path="/p", branch="main", tasks=[task])
+        assert info.progress == (0, 1)
+
+        task.status = "completed"
+        assert info.progress == (1, 1)
+
 
 class TestSaveAndLoadConfig:
     """Tests for save_config and load_config roundtrip."""
@@ -429,3 +476,302 @@ class TestWorktreeInfoDataclass:
         assert len(info.tasks) == 2
         assert info.tasks[0].content == "Task 1"
         assert info.tasks[1].status == "completed"
+
+
+class TestScanCache:
+    """Tests for scan_worktrees caching and the lookup helpers."""
+
+    @pytest.fixture
+    def scan_env(self, tmp_path, monkeypatch):
+        """Isolated home/cwd with a counting fake repo scanner."""
+        import synthia.worktrees as worktrees
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(worktrees, "CONFIG_PATH", tmp_path / "worktrees.yaml")
+        monkeypatch.setattr(worktrees, "_scan_cache", None)
+
+        calls = []
+
+        def fake_scan(repo, session_index, todo_index):
+            calls.append(repo)
+            return [WorktreeInfo(path=str(tmp_path / "wt"), branch="feature/12-x", issue_number=12)]
+
+        monkeypatch.setattr(worktrees, "_scan_repo_worktrees", fake_scan)
+        return calls
+
+    def test_repeated_scans_reuse_cache(self, scan_env):
+        """An unchanged filesystem is only scanned once."""
+        from synthia.worktrees import scan_worktrees
+
+        first = scan_worktrees()
+        second = scan_worktrees()
+
+        assert len(scan_env) == 1
+        assert first == second
+
+    def test_new_session_index_invalidates_cache(self, scan_env, tmp_path):
+        """A new sessions-index.json triggers a rescan."""
+        from synthia.worktrees import scan_worktrees
+
+        scan_worktrees()
+        project = tmp_path / ".claude" / "projects" / "proj"
+        project.mkdir(parents=True)
+        (project / "sessions-index.json").write_text('{"entries": []}')
+        scan_worktrees()
+
+        assert len(scan_env) == 2
+
+    def test_lookups_use_cached_index(self, scan_env, tmp_path):
+        """Path and issue lookups resolve from one scan."""
+        from synthia.worktrees import get_worktree_by_issue, get_worktree_by_path
+
+        by_issue = get_worktree_by_issue(12)
+        by_path = get_worktree_by_path(str(tmp_path / "wt"))
+
+        assert by_issue is not None and by_issue is by_path
+        assert get_worktree_by_issue(99) is None
+        assert len(scan_env) == 1
+
+
+class TestScanLinkedWorktree:
+    """scan_worktrees invalidation against a real git repository."""
+
+    @staticmethod
+    def _git(cwd, *args):
+        import subprocess
+
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+            cwd=cwd,
+            check=True,
+            capture_output=True,
+        )
+
+    def test_rescans_from_inside_a_linked_worktree(self, tmp_path, monkeypatch):
+        """Changes made elsewhere invalidate a scan run from a linked worktree."""
+        import synthia.worktrees as worktrees
+
+        main = tmp_path / "main"
+        main.mkdir()
+        self._git(main, "init", "-q", "-b", "master")
+        self._git(main, "commit", "-q", "--allow-empty", "-m", "init")
+        self._git(main, "worktree", "add", "-q", "-b", "feature/1-a", str(tmp_path / "wt1"))
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setattr(worktrees, "CONFIG_PATH", tmp_path / "worktrees.yaml")
+        monkeypatch.setattr(worktrees, "_scan_cache", None)
+        monkeypatch.setattr(worktrees, "_common_dirs", {})
+        monkeypatch.chdir(tmp_path / "wt1")
+
+        def branches():
+            return [wt.branch for wt in worktrees.scan_worktrees()]
+
+        assert branches() == ["master", "feature/1-a"]
+
+        self._git(main, "worktree", "add", "-q", "-b", "feature/2-b", str(tmp_path / "wt2"))
+        assert branches() == ["master", "feature/1-a", "feature/2-b"]
+
+        self._git(main, "checkout", "-q", "-b", "feature/3-c")
+        assert branches() == ["feature/3-c", "feature/1-a", "feature/2-b"]
+
+
+class TestScanRepoWorktrees:
+    """Tests for _scan_repo_worktrees."""
+
+    def test_enriches_worktrees_in_order(self, monkeypatch):
+        """Worktrees come back in git order with session data attached."""
+        import subprocess
+
+        import synthia.worktrees as worktrees
+
+        porcelain = (
+            "worktree /repo\nHEAD a\nbranch refs/heads/main\n\n"
+            "worktree /repo-12\nHEAD b\nbranch refs/heads/feature/12-x\n"
+        )
+        monkeypatch.setattr(
+            worktrees.subprocess,
+            "run",
+            lambda *a, **k: subprocess.CompletedProcess(a, 0, stdout=porcelain.encode()),
+        )
+        sessions = {str(Path("/repo-12").resolve()): {"sessionId": "s12", "summary": "Issue 12"}}
+        monkeypatch.setattr(
+            worktrees,
+            "_load_tasks_for_session",
+            lambda sid, todo_index: [WorktreeTask(content=sid, status="pending", active_form="")],
+        )
+
+        result = worktrees._scan_repo_worktrees("/repo", sessions, {})
+
+        assert [wt.path for wt in result] == ["/repo", "/repo-12"]
+        assert result[0].session_id is None
+        assert result[1].issue_number == 12
+        assert result[1].session_summary == "Issue 12"
+        assert result[1].tasks[0].content == "s12"
+
+    def test_pooled_enrichment_keeps_git_order(self, monkeypatch):
+        """Repos with several worktrees are enriched in parallel, still in order."""
+        import subprocess
+
+        import synthia.worktrees as worktrees
+
+        paths = [f"/repo-{n}" for n in range(1, 6)]
+        porcelain = "\n".join(
+            f"worktree {p}\nHEAD a\nbranch refs/heads/feature/{p[6:]}-x\n" for p in paths
+        )
+        monkeypatch.setattr(
+            worktrees.subprocess,
+            "run",
+            lambda *a, **k: subprocess.CompletedProcess(a, 0, stdout=porcelain.encode()),
+        )
+
+        result = worktrees._scan_repo_worktrees("/repo", {}, {})
+
+        assert [wt.path for wt in result] == paths
+        assert [wt.issue_number for wt in result] == [1, 2, 3, 4, 5]
+
+
+class TestResolve:
+    """Tests for _resolve."""
+
+    def test_relative_path_follows_chdir(self, tmp_path, monkeypatch):
+        """Relative and empty paths resolve against the current directory every time."""
+        from synthia.worktrees import _resolve
+
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        monkeypatch.chdir(tmp_path / "a")
+        assert _resolve("") == str((tmp_path / "a").resolve())
+        assert _resolve("wt") == str((tmp_path / "a" / "wt").resolve())
+
+        monkeypatch.chdir(tmp_path / "b")
+        assert _resolve("") == str((tmp_path / "b").resolve())
+        assert _resolve("wt") == str((tmp_path / "b" / "wt").resolve())
+
+    def test_absolute_path_is_normalized(self, tmp_path):
+        """Absolute paths are normalized to their canonical form."""
+        from synthia.worktrees import _resolve
+
+        assert _resolve(str(tmp_path / "x" / ".." / "wt")) == str((tmp_path / "wt").resolve())
+
+
+class TestBuildSessionIndex:
+    """Tests for _build_session_index."""
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_indexes_entries_by_resolved_path(self, tmp_path, monkeypatch, has_orjson):
+        """Entries from every project are keyed by resolved projectPath."""
+        import json
+
+        from synthia.worktrees import _build_session_index
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setattr("synthia._jsonio.HAS_ORJSON", has_orjson)
+        projects = tmp_path / ".claude" / "projects"
+        for name, entries in [
+            ("a", [{"projectPath": str(tmp_path / "x" / ".." / "wt1"), "sessionId": "s1"}]),
+            ("b", [{"projectPath": str(tmp_path / "wt2"), "sessionId": "s2"}]),
+        ]:
+            (projects / name).mkdir(parents=True)
+            (projects / name / "sessions-index.json").write_text(json.dumps({"entries": entries}))
+        (projects / "broken").mkdir()
+        (projects / "broken" / "sessions-index.json").write_text("{not json")
+        (projects / "no-index").mkdir()
+        (projects / "stray.txt").write_text("not a project")
+
+        index = _build_session_index()
+
+        assert index[str(tmp_path / "wt1")]["sessionId"] == "s1"
+        assert index[str(tmp_path / "wt2")]["sessionId"] == "s2"
+
+    def test_first_entry_for_a_path_wins(self, tmp_path, monkeypatch):
+        """Later entries for an already indexed path are ignored."""
+        import json
+
+        from synthia.worktrees import _build_session_index
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        project = tmp_path / ".claude" / "projects" / "a"
+        project.mkdir(parents=True)
+        entries = [
+            {"projectPath": str(tmp_path / "wt"), "sessionId": "first"},
+            {"projectPath": str(tmp_path / "wt"), "sessionId": "second"},
+        ]
+        (project / "sessions-index.json").write_text(json.dumps({"entries": entries}))
+
+        assert _build_session_index()[str(tmp_path / "wt")]["sessionId"] == "first"
+
+    def test_missing_projects_dir_returns_empty(self, tmp_path, monkeypatch):
+        """No ~/.claude/projects means no sessions."""
+        from synthia.worktrees import _build_session_index
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert _build_session_index() == {}
+
+
+class TestLoadTasksForSession:
+    """Tests for _load_tasks_for_session."""
+
+    def test_merges_tasks_from_all_agent_files(self, tmp_path, monkeypatch):
+        """Tasks from every agent file of the session are returned."""
+        import json
+
+        from synthia.worktrees import _load_tasks_for_session
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        todos = tmp_path / ".claude" / "todos"
+        todos.mkdir(parents=True)
+        (todos / "sid-agent-1.json").write_text(
+            json.dumps([{"content": "A", "status": "completed", "activeForm": "Doing A"}])
+        )
+        (todos / "sid-agent-2.json").write_text(
+            json.dumps({"tasks": [{"subject": "B"}, "not-a-dict"]})
+        )
+        (todos / "sid-agent-3.json").write_text("{broken")
+        (todos / "other-agent-1.json").write_text(json.dumps([{"content": "C"}]))
+
+        tasks = _load_tasks_for_session("sid")
+
+        assert sorted(t.content for t in tasks) == ["A", "B"]
+        by_content = {t.content: t for t in tasks}
+        assert by_content["A"].active_form == "Doing A"
+        assert by_content["B"].status == "pending"
+
+    def test_no_todos_dir_returns_empty(self, tmp_path, monkeypatch):
+        """Missing ~/.claude/todos yields no tasks."""
+        from synthia.worktrees import _load_tasks_for_session
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert _load_tasks_for_session("sid") == []
+
+    def test_uses_prebuilt_todo_index(self, tmp_path):
+        """A supplied index is used instead of scanning the directory."""
+        import json
+
+        from synthia.worktrees import _load_tasks_for_session
+
+        todo = tmp_path / "sid-agent-9.json"
+        todo.write_text(json.dumps([{"content": "Indexed"}]))
+
+        tasks = _load_tasks_for_session("sid", {"sid": [todo]})
+
+        assert [t.content for t in tasks] == ["Indexed"]
+
+
+class TestIndexTodos:
+    """Tests for _index_todos."""
+
+    def test_groups_agent_files_by_session(self, tmp_path, monkeypatch):
+        """Only {sid}-agent-*.json files are indexed, keyed by session ID."""
+        from synthia.worktrees import _index_todos
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        todos = tmp_path / ".claude" / "todos"
+        todos.mkdir(parents=True)
+        for name in ["s1-agent-a.json", "s1-agent-b.json", "s2-agent-a.json", "notes.json"]:
+            (todos / name).write_text("[]")
+
+        index = _index_todos()
+
+        assert sorted(index) == ["s1", "s2"]
+        assert sorted(p.name for p in index["s1"]) == ["s1-agent-a.json", "s1-agent-b.json"]